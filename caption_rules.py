@@ -2,16 +2,14 @@ import re
 from typing import List, Optional
 
 from .base import Rule
+from . import doc_cache
 from ..models.document_model import DocumentModel, AIAnnotations
 from ..models.findings import Finding
 
 
-CAPTION_FIG_RE = re.compile(r"(?mi)^\s*abbildung\s+\d+\s*[:\.\-–—]\s*\S+")
-CAPTION_TAB_RE = re.compile(r"(?mi)^\s*tabelle\s+\d+\s*[:\.\-–—]\s*\S+")
-
-# auch ohne ":" z.B. "Abbildung 1 Beispiel"
-CAPTION_FIG_RE2 = re.compile(r"(?mi)^\s*abbildung\s+\d+\b\s+\S+")
-CAPTION_TAB_RE2 = re.compile(r"(?mi)^\s*tabelle\s+\d+\b\s+\S+")
+# deckt beide Varianten ab: "Abbildung 1: ..." und (ohne Separator) "Abbildung 1 Beispiel"
+CAPTION_FIG_RE = re.compile(r"(?mi)^\s*abbildung\s+\d+(?:\s*[:\.\-–—]\s*|\s+)\S+")
+CAPTION_TAB_RE = re.compile(r"(?mi)^\s*tabelle\s+\d+(?:\s*[:\.\-–—]\s*|\s+)\S+")
 
 
 class CaptionsPresentRule(Rule):
@@ -23,13 +21,13 @@ class CaptionsPresentRule(Rule):
     severity = "warn"
 
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        text = "\n".join([p for p in doc.paragraphs if p and p.strip()])
+        text = doc_cache.full_text(doc)
 
-        fig_caps = set(CAPTION_FIG_RE.findall(text)) | set(CAPTION_FIG_RE2.findall(text))
-        tab_caps = set(CAPTION_TAB_RE.findall(text)) | set(CAPTION_TAB_RE2.findall(text))
+        fig_caps = set(CAPTION_FIG_RE.findall(text))
+        tab_caps = set(CAPTION_TAB_RE.findall(text))
 
         # Wenn es gar keine Fig/Table-Refs gibt, ist Caption-Check weniger relevant
-        has_refs = (len(getattr(doc, "figure_refs", [])) + len(getattr(doc, "table_refs", []))) > 0
+        has_refs = (len(doc.figure_refs) + len(doc.table_refs)) > 0
         if not has_refs and not fig_caps and not tab_caps:
             return [Finding(self.id, self.category, "info",
                             "Keine Abbildungs-/Tabellenhinweise gefunden – Caption-Check nicht relevant (heuristisch).",
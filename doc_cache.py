@@ -0,0 +1,92 @@
+"""
+Kleine Cache-Helfer, damit Rules teure, pro Dokument identische
+Zwischenergebnisse (z.B. den zusammengefügten Volltext) nicht
+mehrfach neu berechnen.
+
+Die Ergebnisse werden als privates Attribut direkt am DocumentModel
+abgelegt; falls das Model das nicht zulässt, wird einfach ohne Cache
+gerechnet.
+"""
+
+import hashlib
+
+from ..models.document_model import DocumentModel
+
+_FULL_TEXT_ATTR = "_cache_full_text"
+_STRIPPED_ATTR = "_cache_stripped_paragraphs"
+_TITLE_INDEX_ATTR = "_cache_norm_section_titles"
+_FINGERPRINT_ATTR = "_cache_fingerprint"
+
+
+def full_text(doc: DocumentModel) -> str:
+    """
+    Volltext des Dokuments (nicht-leere Absätze, mit '\\n' verbunden),
+    einmal pro Dokument berechnet.
+    """
+    cached = getattr(doc, _FULL_TEXT_ATTR, None)
+    if cached is None:
+        cached = "\n".join(p for p in doc.paragraphs if p)
+        try:
+            setattr(doc, _FULL_TEXT_ATTR, cached)
+        except Exception:
+            pass
+    return cached
+
+
+def stripped_paragraphs(doc: DocumentModel) -> list:
+    """
+    Nicht-leere, gestrippte Absätze als Liste, einmal pro Dokument
+    (mehrere Rules bauen sonst jeweils ihre eigene Kopie).
+    """
+    cached = getattr(doc, _STRIPPED_ATTR, None)
+    if cached is None:
+        cached = [p.strip() for p in doc.paragraphs if p and p.strip()]
+        try:
+            setattr(doc, _STRIPPED_ATTR, cached)
+        except Exception:
+            pass
+    return cached
+
+
+def section_title_index(doc: DocumentModel, norm) -> dict:
+    """
+    {normalisierter Titel: section_key}, einmal pro Dokument.
+
+    norm ist die Titel-Normalisierung des Callers; alle Caller müssen
+    dieselbe verwenden, da der Index pro Dokument nur einmal gebaut wird.
+    Bei gleichem normalisierten Titel gewinnt die erste Section.
+    """
+    cached = getattr(doc, _TITLE_INDEX_ATTR, None)
+    if cached is None:
+        cached = {}
+        for key, sec in doc.sections.items():
+            cached.setdefault(norm(sec.title), key)
+        try:
+            setattr(doc, _TITLE_INDEX_ATTR, cached)
+        except Exception:
+            pass
+    return cached
+
+
+def fingerprint(doc: DocumentModel) -> str:
+    """
+    blake2b-Fingerprint über die prüf-relevanten Dokumentinhalte
+    (Volltext, Section-Titel, Headings, Tabellen-/Abbildungszahlen).
+    Gleicher Fingerprint => Rules liefern dieselben Findings; der Wert
+    wird z.B. als Cache-Key für Rule-Ergebnisse benutzt.
+    """
+    cached = getattr(doc, _FINGERPRINT_ATTR, None)
+    if cached is None:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(full_text(doc).encode("utf-8"))
+        for key, sec in doc.sections.items():
+            h.update(f"\x00{key}\x00{sec.title}\x00{sec.word_count}".encode("utf-8"))
+        for hd in getattr(doc, "headings", []) or []:
+            h.update(f"\x00{getattr(hd, 'level', '')}\x00{getattr(hd, 'number', '')}\x00{getattr(hd, 'text', '')}".encode("utf-8"))
+        h.update(f"\x00{getattr(doc, 'tables_count', 0)}\x00{len(getattr(doc, 'figure_refs', None) or ())}".encode("utf-8"))
+        cached = h.hexdigest()
+        try:
+            setattr(doc, _FINGERPRINT_ATTR, cached)
+        except Exception:
+            pass
+    return cached
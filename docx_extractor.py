@@ -1,455 +1,523 @@
-from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Iterator
-import re
-import unicodedata
-import zipfile
-import xml.etree.ElementTree as ET
-
-from docx import Document
-
-from ..models.document_model import DocumentModel, Heading, Section, CitationSignals
-
-
-SECTION_KEYWORDS: Dict[str, List[str]] = {
-    "abstract": ["abstract", "kurzfassung", "executive summary"],
-    "abkuerzungen": [
-        "abkürzungsverzeichnis",
-        "abkuerzungsverzeichnis",
-        "abkürzungen",
-        "abkuerzungen",
-        "list of abbreviations",
-        "abbreviations",
-    ],
-    "einleitung": ["einleitung", "introduction"],
-    "theorie": [
-        "theorie",
-        "grundlagen",
-        "theoretische grundlagen",
-        "theoretischer hintergrund",
-        "stand der forschung",
-        "forschungsstand",
-        "background",
-        "theoretical background",
-    ],
-    "methode": ["methode", "methodik", "methods", "methodology"],
-    "ergebnisse": ["ergebnisse", "results"],
-    "diskussion": ["diskussion", "discussion"],
-    "fazit": [
-        "fazit",
-        "schluss",
-        "schlussfolgerung",
-        "schlussfolgerungen",
-        "zusammenfassung",
-        "conclusion",
-        "conclusions",
-        "summary",
-        "ausblick",
-    ],
-    "literatur": [
-        "literaturverzeichnis",
-        "references",
-        "bibliography",
-        "quellenverzeichnis",
-        "quellen",
-    ],
-}
-
-# erkennt: "1 Titel", "1. Titel", "1.2 Titel", "1.2.3 Titel"
-NUMBERING_RE = re.compile(r"^\s*(\d+(?:\.\d+)*)(?:\.)?\s+(.+)$")
-
-STRICT_ONLY_KEYS = {"literatur", "ergebnisse", "diskussion", "abstract", "abkuerzungen"}
-PREFIX_OK_KEYS = {"einleitung", "theorie", "methode", "fazit"}
-
-_W_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
-
-
-def _word_count(text: str) -> int:
-    return len(re.findall(r"\w+", text, flags=re.UNICODE))
-
-
-def _normalize_simple(s: str) -> str:
-    s = unicodedata.normalize("NFKC", s or "")
-    s = s.replace("\u00A0", " ")
-    s = re.sub(r"\s+", " ", s).strip().lower()
-    return s
-
-
-def _normalize_title(title: str) -> str:
-    t = title or ""
-    t = unicodedata.normalize("NFKC", t)
-    t = t.replace("\u00A0", " ")
-    t = t.strip().lower()
-
-    # führende Nummern entfernen: "9. Literaturverzeichnis", "9) Literaturverzeichnis", "9 Literaturverzeichnis"
-    t = re.sub(r"^\s*\d+(?:\.\d+)*\s*[\.\)]?\s*", "", t)
-
-    # trailing punctuation entfernen (z.B. ":" am Ende)
-    t = re.sub(r"[\s:;.\-–—]+$", "", t).strip()
-
-    # whitespace normalisieren
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
-
-
-def _looks_like_toc_line(p: str) -> bool:
-    """
-    Robustere TOC-Heuristik (dein TOC hat oft keine Spaces: "1.Einleitung1")
-    """
-    t = _normalize_simple(p)
-    if not t:
-        return False
-
-    if "...." in t or re.search(r"\.{3,}", t):
-        return True
-
-    # "1.Einleitung1" / "4.2GAN17" (Nummer + Text + Seitenzahl direkt angehängt)
-    if re.match(r"^\d+(\.\d+)*[a-zäöüß].*\d{1,4}$", t):
-        return True
-
-    # "6. Ergebnisse 24" / "Ergebnisse 24"
-    if re.match(r"^\d+(\.\d+)*\s+.+\s+\d{1,4}$", t):
-        return True
-    if re.match(r"^[a-zäöüß].+\s+\d{1,4}$", t):
-        return True
-
-    return False
-
-
-def _find_toc_range(paragraphs: List[str]) -> Optional[Tuple[int, int]]:
-    """
-    Findet TOC als (start_idx, end_idx), end_idx = erster Absatz NACH dem TOC.
-    """
-    toc_start = None
-    for i, p in enumerate(paragraphs):
-        if _normalize_simple(p) == "inhaltsverzeichnis":
-            toc_start = i
-            break
-    if toc_start is None:
-        return None
-
-    max_scan = min(len(paragraphs), toc_start + 500)
-
-    for j in range(toc_start + 1, max_scan):
-        window = [x for x in paragraphs[j: min(max_scan, j + 8)] if _normalize_simple(x)]
-        if not window:
-            continue
-        non_toc = sum(1 for x in window if not _looks_like_toc_line(x))
-        if non_toc >= 5:
-            return (toc_start, j)
-
-    return (toc_start, min(len(paragraphs), toc_start + 250))
-
-
-def _find_section_key(title: str, *, level: Optional[int] = None, number: Optional[str] = None) -> Optional[str]:
-    t = _normalize_title(title)
-    if not t:
-        return None
-
-    if re.search(r"\bliteraturrecherche\b", t):
-        return None
-
-    is_top_level = False
-    if level is not None and level == 1:
-        is_top_level = True
-    if number and number.isdigit():
-        is_top_level = True
-
-    # 1) STRICT-only Keys: exakt matchen
-    for key in STRICT_ONLY_KEYS:
-        for kw in SECTION_KEYWORDS.get(key, []):
-            if t == _normalize_title(kw):
-                return key
-
-    # 2) Restliche Keys: exakt matchen
-    for key, kws in SECTION_KEYWORDS.items():
-        if key in STRICT_ONLY_KEYS:
-            continue
-        for kw in kws:
-            if t == _normalize_title(kw):
-                return key
-
-    # 3) Prefix-Match nur für bestimmte Keys und nur top-level
-    if is_top_level:
-        for key in PREFIX_OK_KEYS:
-            for kw in SECTION_KEYWORDS.get(key, []):
-                kw_n = _normalize_title(kw)
-                if kw_n and t.startswith(kw_n + " "):
-                    return key
-
-    # 4) Speziell für Theorie: viele Arbeiten nennen das Kapitel "Theoretische Grundlagen" / "Stand der Forschung"
-    if is_top_level:
-        if re.search(r"\b(theorie|grundlagen|theoretisch|forschungsstand|stand der forschung|background)\b", t):
-            return "theorie"
-
-    return None
-
-
-# -----------------------------
-# XML-basierte Extraktion (Citavi/SDT robust) + TABLE-AWARE WALK
-# -----------------------------
-
-def _read_document_xml(path: Path) -> ET.Element:
-    with zipfile.ZipFile(str(path)) as z:
-        xml_bytes = z.read("word/document.xml")
-    return ET.fromstring(xml_bytes)
-
-
-def _p_text(p: ET.Element) -> str:
-    parts = []
-    for t in p.findall(".//w:t", _W_NS):
-        if t.text:
-            parts.append(t.text)
-    txt = "".join(parts)
-    txt = unicodedata.normalize("NFKC", txt).replace("\u00A0", " ").strip()
-    return txt
-
-
-def _p_style(p: ET.Element) -> str:
-    """
-    Word Style-ID auslesen: w:pPr/w:pStyle/@w:val
-    """
-    ppr = p.find("./w:pPr", _W_NS)
-    if ppr is None:
-        return ""
-    ps = ppr.find("./w:pStyle", _W_NS)
-    if ps is None:
-        return ""
-    val = ps.attrib.get(f"{{{_W_NS['w']}}}val", "")
-    return (val or "").strip().lower()
-
-
-def _p_ilvl(p: ET.Element) -> Optional[int]:
-    """
-    Liest Word-Nummerierungs-Level aus: w:pPr/w:numPr/w:ilvl/@w:val
-    ilvl 0 => Level 1, ilvl 1 => Level 2, ...
-    """
-    ppr = p.find("./w:pPr", _W_NS)
-    if ppr is None:
-        return None
-    numpr = ppr.find("./w:numPr", _W_NS)
-    if numpr is None:
-        return None
-    ilvl = numpr.find("./w:ilvl", _W_NS)
-    if ilvl is None:
-        return None
-    val = ilvl.attrib.get(f"{{{_W_NS['w']}}}val", "")
-    try:
-        return int(val)
-    except Exception:
-        return None
-
-
-def _heading_level_from_style(style_id: str) -> Optional[int]:
-    """
-    Extrahiert Heading-Level aus Word Style-ID.
-    Robust für:
-      - heading1 / heading 1
-      - überschrift1 / überschrift 1
-      - berschrift1 (kommt oft in DE-Templates vor, ohne Ü)
-    """
-    s = (style_id or "").strip().lower()
-    if not s:
-        return None
-
-    m = re.search(r"(heading|überschrift|berschrift)\s*([1-9])", s)
-    if m:
-        try:
-            return int(m.group(2))
-        except Exception:
-            return None
-
-    m2 = re.search(r"(heading|überschrift|berschrift)([1-9])", s)
-    if m2:
-        try:
-            return int(m2.group(2))
-        except Exception:
-            return None
-
-    if "heading" in s or "überschrift" in s or "berschrift" in s:
-        return 1
-
-    return None
-
-
-def _walk_body_paragraphs(body: ET.Element) -> Iterator[Tuple[ET.Element, bool]]:
-    """
-    Walkt den XML-Body in Dokument-Reihenfolge und yieldet (paragraph, in_table).
-    Damit können wir Headings aus Tabellen konsequent ignorieren.
-    """
-    def walk(node: ET.Element, in_table: bool) -> Iterator[Tuple[ET.Element, bool]]:
-        for child in list(node):
-            tag = child.tag.split("}")[-1]  # localname
-            if tag == "tbl":
-                yield from walk(child, True)
-            elif tag == "p":
-                yield (child, in_table)
-            else:
-                yield from walk(child, in_table)
-
-    yield from walk(body, False)
-
-
-def _extract_paragraphs_and_headings_from_xml(path: Path) -> Tuple[List[str], List[Heading]]:
-    root = _read_document_xml(path)
-    body = root.find(".//w:body", _W_NS)
-    if body is None:
-        return [], []
-
-    paragraphs: List[str] = []
-    headings: List[Heading] = []
-
-    # Zähler für Auto-Nummerierung (aus numPr/ilvl)
-    auto_counts = [0] * 10  # 1..9 genutzt
-
-    for idx, (p, in_table) in enumerate(_walk_body_paragraphs(body)):
-        text = _p_text(p)
-        if not text:
-            paragraphs.append("")
-            continue
-
-        paragraphs.append(text)
-
-        # Headings nur außerhalb von Tabellen
-        if in_table:
-            continue
-
-        style = _p_style(p)
-        level_from_style = _heading_level_from_style(style)
-        is_heading_style = level_from_style is not None
-
-        ilvl = _p_ilvl(p)
-
-        number: Optional[str] = None
-        title = text
-        m = NUMBERING_RE.match(text)
-        if m:
-            number = m.group(1)
-            title = m.group(2).strip()
-
-        # Auto-Nummerierung aus Word numPr/ilvl => Nummern selbst hochzählen
-        if number is None and is_heading_style and ilvl is not None:
-            lvl = max(1, min(9, ilvl + 1))  # ilvl 0->1, 1->2, ...
-            auto_counts[lvl] += 1
-            for k in range(lvl + 1, 10):
-                auto_counts[k] = 0
-            if lvl > 1 and auto_counts[1] == 0:
-                auto_counts[1] = 1
-            number = ".".join(str(auto_counts[k]) for k in range(1, lvl + 1))
-
-        looks_like_known_section = (
-            _find_section_key(
-                title,
-                level=level_from_style if level_from_style is not None else (number.count(".") + 1 if number else None),
-                number=number,
-            )
-            is not None
-        )
-
-        if is_heading_style or (number and len(text) <= 120) or (looks_like_known_section and len(title) <= 60):
-            if number:
-                level = number.count(".") + 1
-            elif level_from_style is not None:
-                level = level_from_style
-            else:
-                level = 1
-
-            headings.append(Heading(text=title, level=level, number=number, para_index=idx))
-
-    # Inhaltsverzeichnis finden und Headings darin ignorieren
-    toc = _find_toc_range(paragraphs)
-    if toc:
-        toc_start, toc_end = toc
-        filtered: List[Heading] = []
-        for h in headings:
-            if toc_start <= h.para_index < toc_end and _looks_like_toc_line(paragraphs[h.para_index]):
-                continue
-            filtered.append(h)
-        headings = filtered
-
-    return paragraphs, headings
-
-
-def _build_sections(paragraphs: List[str], headings: List[Heading]) -> Dict[str, Section]:
-    sections: Dict[str, Section] = {}
-    hs = sorted(headings, key=lambda x: x.para_index)
-
-    sec_keys: List[Optional[str]] = [
-        _find_section_key(h.text, level=h.level, number=h.number) for h in hs
-    ]
-
-    for i, h in enumerate(hs):
-        key = sec_keys[i]
-        if not key:
-            continue
-        if key in sections:
-            continue
-
-        start = h.para_index + 1
-
-        end = len(paragraphs)
-        for j in range(i + 1, len(hs)):
-            if sec_keys[j]:
-                end = hs[j].para_index
-                break
-
-        slice_paras = [p for p in paragraphs[start:end] if p and p.strip()]
-        section_text = "\n".join(slice_paras).strip()
-
-        sections[key] = Section(
-            key=key,
-            title=h.text,
-            start_para=start,
-            end_para=max(start, end - 1),
-            text=section_text,
-            word_count=_word_count(section_text),
-        )
-
-    return sections
-
-
-def _extract_references(paragraphs: List[str]) -> Tuple[List[str], List[str]]:
-    text = "\n".join([p for p in paragraphs if p])
-    fig = re.findall(r"\bAbbildung\s+\d+\b", text, flags=re.IGNORECASE)
-    tab = re.findall(r"\bTabelle\s+\d+\b", text, flags=re.IGNORECASE)
-    fig = [f.title() for f in fig]
-    tab = [t.title() for t in tab]
-    return sorted(set(fig)), sorted(set(tab))
-
-
-def _extract_citation_signals(paragraphs: List[str]) -> CitationSignals:
-    text = "\n".join([p for p in paragraphs if p])
-    blocks = re.findall(r"\[([^\]]*?\d[^\]]*?)\]", text)
-
-    numeric_count = 0
-    for b in blocks:
-        b = b.replace("–", "-").replace("—", "-")
-        if re.findall(r"\d+", b):
-            numeric_count += 1
-
-    author_year = len(re.findall(r"\([A-ZÄÖÜ][A-Za-zÄÖÜäöüß\-]+,\s*\d{4}\)", text))
-    etal = len(re.findall(r"\bet\s+al\.", text, flags=re.IGNORECASE))
-    return CitationSignals(numeric_count=numeric_count, author_year_count=author_year, etal_count=etal)
-
-
-def extract_docx(path: Path) -> DocumentModel:
-    doc = Document(str(path))
-
-    paragraphs, headings = _extract_paragraphs_and_headings_from_xml(path)
-    sections = _build_sections(paragraphs, headings)
-
-    figures, tables = _extract_references(paragraphs)
-    citations = _extract_citation_signals(paragraphs)
-
-    full_text = "\n".join([p for p in paragraphs if p])
-
-    return DocumentModel(
-        filename=path.name,
-        paragraphs=paragraphs,
-        headings=headings,
-        sections=sections,
-        word_count_total=_word_count(full_text),
-        tables_count=len(doc.tables),
-        figure_refs=figures,
-        table_refs=tables,
-        citations=citations,
-    )
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Iterator
+import functools
+import re
+import unicodedata
+import zipfile
+
+from lxml import etree as ET
+
+from ..models.document_model import DocumentModel, Heading, Section, CitationSignals
+
+
+SECTION_KEYWORDS: Dict[str, List[str]] = {
+    "abstract": ["abstract", "kurzfassung", "executive summary"],
+    "abkuerzungen": [
+        "abkürzungsverzeichnis",
+        "abkuerzungsverzeichnis",
+        "abkürzungen",
+        "abkuerzungen",
+        "list of abbreviations",
+        "abbreviations",
+    ],
+    "einleitung": ["einleitung", "introduction"],
+    "theorie": [
+        "theorie",
+        "grundlagen",
+        "theoretische grundlagen",
+        "theoretischer hintergrund",
+        "stand der forschung",
+        "forschungsstand",
+        "background",
+        "theoretical background",
+    ],
+    "methode": ["methode", "methodik", "methods", "methodology"],
+    "ergebnisse": ["ergebnisse", "results"],
+    "diskussion": ["diskussion", "discussion"],
+    "fazit": [
+        "fazit",
+        "schluss",
+        "schlussfolgerung",
+        "schlussfolgerungen",
+        "zusammenfassung",
+        "conclusion",
+        "conclusions",
+        "summary",
+        "ausblick",
+    ],
+    "literatur": [
+        "literaturverzeichnis",
+        "references",
+        "bibliography",
+        "quellenverzeichnis",
+        "quellen",
+    ],
+}
+
+# erkennt: "1 Titel", "1. Titel", "1.2 Titel", "1.2.3 Titel"
+NUMBERING_RE = re.compile(r"^\s*(\d+(?:\.\d+)*)(?:\.)?\s+(.+)$")
+
+STRICT_ONLY_KEYS = {"literatur", "ergebnisse", "diskussion", "abstract", "abkuerzungen"}
+PREFIX_OK_KEYS = {"einleitung", "theorie", "methode", "fazit"}
+
+_W_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+
+# fertig aufgelöste Tag-Namen (Clark-Notation), spart das XPath-Parsen pro Absatz
+_W = _W_NS["w"]
+_W_T = f"{{{_W}}}t"
+_W_PPR = f"{{{_W}}}pPr"
+_W_PSTYLE = f"{{{_W}}}pStyle"
+_W_NUMPR = f"{{{_W}}}numPr"
+_W_ILVL = f"{{{_W}}}ilvl"
+_W_VAL = f"{{{_W}}}val"
+
+# optional: das 'regex'-Modul ist für die Volltext-Scans messbar schneller
+# als stdlib re; wenn es fehlt, läuft alles unverändert mit re weiter
+try:
+    import regex as _re_engine
+except ImportError:
+    _re_engine = re
+
+# vorkompilierte Patterns (laufen pro Dokument über den Volltext)
+_WORD_RE = re.compile(r"\w+", flags=re.UNICODE)
+_FIG_REF_RE = _re_engine.compile(r"\bAbbildung\s+\d+\b", flags=re.IGNORECASE)
+_TAB_REF_RE = _re_engine.compile(r"\bTabelle\s+\d+\b", flags=re.IGNORECASE)
+_CITE_BLOCK_RE = _re_engine.compile(r"\[([^\]]*?\d[^\]]*?)\]")
+_AUTHOR_YEAR_RE = _re_engine.compile(r"\([A-ZÄÖÜ][A-Za-zÄÖÜäöüß\-]+,\s*\d{4}\)")
+_ETAL_RE = _re_engine.compile(r"\bet\s+al\.", flags=re.IGNORECASE)
+
+
+def _word_count(text: str) -> int:
+    # finditer statt findall: zählt ohne eine Wegwerf-Liste aller Wörter zu bauen
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+_WS_RE = re.compile(r"\s+")
+_LEADING_NUM_RE = re.compile(r"^\s*\d+(?:\.\d+)*\s*[\.\)]?\s*")
+_TRAILING_PUNCT_RE = re.compile(r"[\s:;.\-–—]+$")
+
+
+# lru_cache: die Inputs wiederholen sich stark (Keyword-Liste + Headings/TOC-Zeilen),
+# damit läuft die Normalisierung pro String praktisch nur einmal.
+@functools.lru_cache(maxsize=4096)
+def _normalize_simple(s: str) -> str:
+    s = unicodedata.normalize("NFKC", s or "")
+    s = s.replace("\u00A0", " ")
+    s = _WS_RE.sub(" ", s).strip().lower()
+    return s
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_title(title: str) -> str:
+    t = title or ""
+    t = unicodedata.normalize("NFKC", t)
+    t = t.replace("\u00A0", " ")
+    t = t.strip().lower()
+
+    # führende Nummern entfernen: "9. Literaturverzeichnis", "9) Literaturverzeichnis", "9 Literaturverzeichnis"
+    t = _LEADING_NUM_RE.sub("", t)
+
+    # trailing punctuation entfernen (z.B. ":" am Ende)
+    t = _TRAILING_PUNCT_RE.sub("", t).strip()
+
+    # whitespace normalisieren
+    t = _WS_RE.sub(" ", t).strip()
+    return t
+
+
+# alle TOC-Formen (außer Leaderpunkten, die prüft "..." in t schneller):
+#   - "1.Einleitung1" / "4.2GAN17" (Nummer + Text + Seitenzahl direkt angehängt)
+#   - "6. Ergebnisse 24" / "Ergebnisse 24"
+_TOC_LINE_RE = re.compile(
+    r"^\d+(?:\.\d+)*[a-zäöüß].*\d{1,4}$"
+    r"|^\d+(?:\.\d+)*\s+.+\s+\d{1,4}$"
+    r"|^[a-zäöüß].+\s+\d{1,4}$"
+)
+
+
+# mögliche Startzeichen einer TOC-Zeile;
+# alles andere kann ohne Regex-Aufruf verworfen werden
+_TOC_FIRST_CHARS = frozenset("0123456789abcdefghijklmnopqrstuvwxyzäöüß.")
+
+
+def _looks_like_toc_line(p: str) -> bool:
+    """
+    Robustere TOC-Heuristik (dein TOC hat oft keine Spaces: "1.Einleitung1")
+    """
+    t = _normalize_simple(p)
+    if not t:
+        return False
+    if "..." in t:
+        # Leaderpunkte: der Substring-Check erledigt das ohne Regex
+        return True
+    if t[0] not in _TOC_FIRST_CHARS:
+        return False
+    return _TOC_LINE_RE.search(t) is not None
+
+
+def _find_toc_range(paragraphs: List[str]) -> Optional[Tuple[int, int]]:
+    """
+    Findet TOC als (start_idx, end_idx), end_idx = erster Absatz NACH dem TOC.
+    """
+    toc_start = None
+    for i, p in enumerate(paragraphs):
+        if _normalize_simple(p) == "inhaltsverzeichnis":
+            toc_start = i
+            break
+    if toc_start is None:
+        return None
+
+    max_scan = min(len(paragraphs), toc_start + 500)
+
+    # jede Zeile einmal klassifizieren (1 = nicht-leer und keine TOC-Zeile),
+    # dann Sliding Window statt pro Position neue 8er-Slices zu bauen
+    flags = [
+        1 if (_normalize_simple(x) and not _looks_like_toc_line(x)) else 0
+        for x in paragraphs[toc_start + 1: max_scan]
+    ]
+
+    window = 8
+    non_toc = sum(flags[:window])
+    for off in range(len(flags)):
+        if non_toc >= 5:
+            return (toc_start, toc_start + 1 + off)
+        non_toc -= flags[off]
+        if off + window < len(flags):
+            non_toc += flags[off + window]
+
+    return (toc_start, min(len(paragraphs), toc_start + 250))
+
+
+# Lookup-Tabellen einmal beim Import aufbauen statt pro Heading alle
+# Keywords zu normalisieren und linear zu vergleichen.
+_KW_TO_KEY_STRICT = {
+    _normalize_title(kw): key
+    for key in STRICT_ONLY_KEYS
+    for kw in SECTION_KEYWORDS.get(key, [])
+}
+_KW_TO_KEY_REST = {
+    _normalize_title(kw): key
+    for key, kws in SECTION_KEYWORDS.items()
+    if key not in STRICT_ONLY_KEYS
+    for kw in kws
+}
+_PREFIX_KWS = tuple(
+    (_normalize_title(kw) + " ", key)
+    for key in PREFIX_OK_KEYS
+    for kw in SECTION_KEYWORDS.get(key, [])
+    if _normalize_title(kw)
+)
+
+
+def _find_section_key(title: str, *, level: Optional[int] = None, number: Optional[str] = None) -> Optional[str]:
+    t = _normalize_title(title)
+    if not t:
+        return None
+
+    if re.search(r"\bliteraturrecherche\b", t):
+        return None
+
+    is_top_level = False
+    if level is not None and level == 1:
+        is_top_level = True
+    if number and number.isdigit():
+        is_top_level = True
+
+    # 1) STRICT-only Keys: exakt matchen
+    key = _KW_TO_KEY_STRICT.get(t)
+    if key:
+        return key
+
+    # 2) Restliche Keys: exakt matchen
+    key = _KW_TO_KEY_REST.get(t)
+    if key:
+        return key
+
+    # 3) Prefix-Match nur für bestimmte Keys und nur top-level
+    if is_top_level:
+        for prefix, pkey in _PREFIX_KWS:
+            if t.startswith(prefix):
+                return pkey
+
+    # 4) Speziell für Theorie: viele Arbeiten nennen das Kapitel "Theoretische Grundlagen" / "Stand der Forschung"
+    if is_top_level:
+        if re.search(r"\b(theorie|grundlagen|theoretisch|forschungsstand|stand der forschung|background)\b", t):
+            return "theorie"
+
+    return None
+
+
+# -----------------------------
+# XML-basierte Extraktion (Citavi/SDT robust) + TABLE-AWARE WALK
+# -----------------------------
+
+def _read_document_xml(path: Path) -> ET.Element:
+    # Stream statt z.read(): der Parser liest direkt aus dem Zip-Eintrag,
+    # ohne das komplette dekomprimierte XML zusätzlich als bytes zu halten
+    with zipfile.ZipFile(str(path)) as z:
+        with z.open("word/document.xml") as f:
+            return ET.parse(f).getroot()
+
+
+def _p_text(p: ET.Element) -> str:
+    txt = "".join(t.text for t in p.iter(_W_T) if t.text)
+    return unicodedata.normalize("NFKC", txt).replace("\u00A0", " ").strip()
+
+
+def _p_style(p: ET.Element) -> str:
+    """
+    Word Style-ID auslesen: w:pPr/w:pStyle/@w:val
+    """
+    ppr = p.find(_W_PPR)
+    if ppr is None:
+        return ""
+    ps = ppr.find(_W_PSTYLE)
+    if ps is None:
+        return ""
+    val = ps.get(_W_VAL, "")
+    return (val or "").strip().lower()
+
+
+def _p_ilvl(p: ET.Element) -> Optional[int]:
+    """
+    Liest Word-Nummerierungs-Level aus: w:pPr/w:numPr/w:ilvl/@w:val
+    ilvl 0 => Level 1, ilvl 1 => Level 2, ...
+    """
+    ppr = p.find(_W_PPR)
+    if ppr is None:
+        return None
+    numpr = ppr.find(_W_NUMPR)
+    if numpr is None:
+        return None
+    ilvl = numpr.find(_W_ILVL)
+    if ilvl is None:
+        return None
+    val = ilvl.get(_W_VAL, "")
+    try:
+        return int(val)
+    except Exception:
+        return None
+
+
+# ein Pattern für alle Varianten; die optionale Ziffer deckt
+# "heading1" / "heading 1" / nur "heading" (=> Level 1) gleichzeitig ab
+_HEADING_STYLE_RE = re.compile(r"(?:heading|überschrift|berschrift)\s*([1-9])?")
+
+
+@functools.lru_cache(maxsize=64)
+def _heading_level_from_style(style_id: str) -> Optional[int]:
+    """
+    Extrahiert Heading-Level aus Word Style-ID.
+    Robust für:
+      - heading1 / heading 1
+      - überschrift1 / überschrift 1
+      - berschrift1 (kommt oft in DE-Templates vor, ohne Ü)
+
+    Style-IDs wiederholen sich stark (meist <5 pro Dokument), daher lru_cache.
+    """
+    s = (style_id or "").strip().lower()
+    if not s:
+        return None
+
+    m = _HEADING_STYLE_RE.search(s)
+    if m is None:
+        return None
+    return int(m.group(1)) if m.group(1) else 1
+
+
+def _walk_body_paragraphs(body: ET.Element) -> Iterator[Tuple[str, ET.Element, bool]]:
+    """
+    Walkt den XML-Body in Dokument-Reihenfolge und yieldet (kind, element, in_table)
+    mit kind "p" oder "tbl". Damit können wir Headings aus Tabellen konsequent
+    ignorieren und Tabellen gleich mitzählen.
+    """
+    def walk(node: ET.Element, in_table: bool) -> Iterator[Tuple[str, ET.Element, bool]]:
+        for child in node:
+            if not isinstance(child.tag, str):
+                continue  # Kommentare / Processing Instructions
+            tag = child.tag.split("}")[-1]  # localname
+            if tag == "tbl":
+                yield ("tbl", child, in_table)
+                yield from walk(child, True)
+            elif tag == "p":
+                yield ("p", child, in_table)
+            else:
+                yield from walk(child, in_table)
+
+    yield from walk(body, False)
+
+
+def _extract_paragraphs_and_headings_from_xml(path: Path) -> Tuple[List[str], List[Heading], int]:
+    root = _read_document_xml(path)
+    body = root.find(".//w:body", _W_NS)
+    if body is None:
+        return [], [], 0
+
+    paragraphs: List[str] = []
+    headings: List[Heading] = []
+    tables_count = 0
+
+    # Zähler für Auto-Nummerierung (aus numPr/ilvl)
+    auto_counts = [0] * 10  # 1..9 genutzt
+
+    for kind, p, in_table in _walk_body_paragraphs(body):
+        if kind == "tbl":
+            # wie python-docx: nur Top-Level-Tabellen zählen
+            if not in_table:
+                tables_count += 1
+            continue
+
+        idx = len(paragraphs)
+        text = _p_text(p)
+        if not text:
+            paragraphs.append("")
+            continue
+
+        paragraphs.append(text)
+
+        # Headings nur außerhalb von Tabellen
+        if in_table:
+            continue
+
+        style = _p_style(p)
+        level_from_style = _heading_level_from_style(style)
+        is_heading_style = level_from_style is not None
+
+        ilvl = _p_ilvl(p)
+
+        number: Optional[str] = None
+        title = text
+        # Absätze sind schon gestrippt -> nur Texte mit Ziffer am Anfang
+        # können überhaupt matchen, der Rest spart sich den Regex-Aufruf
+        m = NUMBERING_RE.match(text) if text[:1].isdigit() else None
+        if m:
+            number = m.group(1)
+            title = m.group(2).strip()
+
+        # Auto-Nummerierung aus Word numPr/ilvl => Nummern selbst hochzählen
+        if number is None and is_heading_style and ilvl is not None:
+            lvl = max(1, min(9, ilvl + 1))  # ilvl 0->1, 1->2, ...
+            auto_counts[lvl] += 1
+            # tiefere Level per Slice-Zuweisung zurücksetzen (C-Level statt Schleife)
+            auto_counts[lvl + 1:] = [0] * (len(auto_counts) - lvl - 1)
+            if lvl > 1 and auto_counts[1] == 0:
+                auto_counts[1] = 1
+            number = ".".join(map(str, auto_counts[1:lvl + 1]))
+
+        looks_like_known_section = (
+            _find_section_key(
+                title,
+                level=level_from_style if level_from_style is not None else (number.count(".") + 1 if number else None),
+                number=number,
+            )
+            is not None
+        )
+
+        if is_heading_style or (number and len(text) <= 120) or (looks_like_known_section and len(title) <= 60):
+            if number:
+                level = number.count(".") + 1
+            elif level_from_style is not None:
+                level = level_from_style
+            else:
+                level = 1
+
+            headings.append(Heading(text=title, level=level, number=number, para_index=idx))
+
+    # Inhaltsverzeichnis finden und Headings darin ignorieren
+    toc = _find_toc_range(paragraphs)
+    if toc:
+        toc_start, toc_end = toc
+        filtered: List[Heading] = []
+        for h in headings:
+            if toc_start <= h.para_index < toc_end and _looks_like_toc_line(paragraphs[h.para_index]):
+                continue
+            filtered.append(h)
+        headings = filtered
+
+    return paragraphs, headings, tables_count
+
+
+def _build_sections(paragraphs: List[str], headings: List[Heading]) -> Dict[str, Section]:
+    sections: Dict[str, Section] = {}
+    # Headings kommen aus dem Body-Walk bereits in Dokument-Reihenfolge
+    hs = headings
+
+    sec_keys: List[Optional[str]] = [
+        _find_section_key(h.text, level=h.level, number=h.number) for h in hs
+    ]
+
+    # Ende jeder Section in einem Rückwärts-Pass bestimmen statt pro Heading
+    # erneut vorwärts zu suchen (war O(M*K))
+    section_ends: List[int] = [len(paragraphs)] * len(hs)
+    next_end = len(paragraphs)
+    for i in range(len(hs) - 1, -1, -1):
+        section_ends[i] = next_end
+        if sec_keys[i]:
+            next_end = hs[i].para_index
+
+    for i, h in enumerate(hs):
+        key = sec_keys[i]
+        if not key:
+            continue
+        if key in sections:
+            continue
+
+        start = h.para_index + 1
+        end = section_ends[i]
+
+        # _p_text liefert bereits gestrippte Absätze, "if p" reicht als Filter
+        section_text = "\n".join(p for p in paragraphs[start:end] if p).strip()
+
+        sections[key] = Section(
+            key=key,
+            title=h.text,
+            start_para=start,
+            end_para=max(start, end - 1),
+            text=section_text,
+            word_count=_word_count(section_text),
+        )
+
+    return sections
+
+
+def _extract_references(text: str) -> Tuple[List[str], List[str]]:
+    fig = _FIG_REF_RE.findall(text)
+    tab = _TAB_REF_RE.findall(text)
+    fig = [f.title() for f in fig]
+    tab = [t.title() for t in tab]
+    return sorted(set(fig)), sorted(set(tab))
+
+
+def _extract_citation_signals(text: str) -> CitationSignals:
+    # _CITE_BLOCK_RE verlangt schon eine Ziffer im Block -> der alte
+    # Nachfilter pro Treffer war ein No-Op; wir zählen nur noch Matches
+    # (finditer statt findall: keine Match-Strings-Liste im Speicher)
+    numeric_count = sum(1 for _ in _CITE_BLOCK_RE.finditer(text))
+    author_year = sum(1 for _ in _AUTHOR_YEAR_RE.finditer(text))
+    etal = sum(1 for _ in _ETAL_RE.finditer(text))
+    return CitationSignals(numeric_count=numeric_count, author_year_count=author_year, etal_count=etal)
+
+
+def extract_docx(path: Path) -> DocumentModel:
+    paragraphs, headings, tables_count = _extract_paragraphs_and_headings_from_xml(path)
+    sections = _build_sections(paragraphs, headings)
+
+    # Volltext nur einmal zusammenbauen und an alle Helfer weiterreichen;
+    # Wörter zählen wir dabei pro Absatz mit (\w+ läuft nie über '\n' hinweg)
+    full_text = "\n".join([p for p in paragraphs if p])
+    word_count_total = sum(_word_count(p) for p in paragraphs if p)
+
+    figures, tables = _extract_references(full_text)
+    citations = _extract_citation_signals(full_text)
+
+    return DocumentModel(
+        filename=path.name,
+        paragraphs=paragraphs,
+        headings=headings,
+        sections=sections,
+        word_count_total=word_count_total,
+        tables_count=tables_count,
+        figure_refs=figures,
+        table_refs=tables,
+        citations=citations,
+    )
@@ -2,15 +2,20 @@ import re
 from typing import List, Optional
 
 from .base import Rule
+from . import doc_cache
 from ..models.document_model import DocumentModel, AIAnnotations
 from ..models.findings import Finding
 
 
+# vorkompiliert (wird pro Dokument aufgerufen, re.findall mit String wäre unnötiger Overhead)
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+
+
 def _get_literature_text(doc: DocumentModel) -> str:
     sec = doc.sections.get("literatur")
     if sec and sec.text and sec.text.strip():
         return sec.text
-    return "\n".join([p for p in doc.paragraphs if p])
+    return doc_cache.full_text(doc)
 
 
 class CitationDensityRule(Rule):
@@ -24,7 +29,7 @@ class CitationDensityRule(Rule):
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
         words = max(1, doc.word_count_total)
         # aus CitationSignals: numeric_count zählt Blöcke wie [1], [1-3], [1,4]
-        cite_blocks = getattr(doc.citations, "numeric_count", 0) + getattr(doc.citations, "author_year_count", 0)
+        cite_blocks = doc.citations.numeric_count + doc.citations.author_year_count
         ratio = cite_blocks / words  # cites per word
 
         # grobe Schwellen (kannst du später pro Fach anpassen)
@@ -59,7 +64,7 @@ class ReferenceYearsRule(Rule):
 
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
         lit_text = _get_literature_text(doc)
-        years = re.findall(r"\b(?:19|20)\d{2}\b", lit_text)
+        years = _YEAR_RE.findall(lit_text)
         if not years:
             return [Finding(self.id, self.category, "info",
                             "Keine Jahreszahlen in der Literatur erkannt (heuristisch).",
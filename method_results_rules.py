@@ -53,6 +53,13 @@ class MethodDetailSufficientRule(Rule):
         "validität", "reliabilität",
     ]
 
+    # ein Pattern statt 20 Substring-Scans über den Sektionstext;
+    # längste Keywords zuerst, damit z.B. "datenerhebung" vor "daten" greift
+    _KW_RE = re.compile(
+        "|".join(map(re.escape, sorted(KEYWORDS, key=len, reverse=True))),
+        re.IGNORECASE,
+    )
+
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
         sec = doc.sections.get("methode")
         if sec is None:
@@ -65,9 +72,9 @@ class MethodDetailSufficientRule(Rule):
             )]
 
         wc = sec.word_count
-        text = sec.text.lower()
 
-        hits = [k for k in self.KEYWORDS if k in text]
+        # IGNORECASE spart auch das sec.text.lower()-Duplikat
+        hits = sorted({m.lower() for m in self._KW_RE.findall(sec.text)})
 
         # Schwellenwerte (kannst du später fein-tunen)
         min_words = 300
@@ -127,6 +134,13 @@ class ResultsDiscussionSeparationRule(Rule):
         "verglichen", "vergleich", "literatur", "studien zeigen",
     ]
 
+    # wie bei METH-020: eine IGNORECASE-Alternation statt 14 Substring-Scans
+    # über zwei gelowerte Kopien der Sektionstexte
+    _CUE_RE = re.compile(
+        "|".join(map(re.escape, sorted(INTERPRETATION_CUES, key=len, reverse=True))),
+        re.IGNORECASE,
+    )
+
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
         res = doc.sections.get("ergebnisse")
         disc = doc.sections.get("diskussion")
@@ -140,11 +154,8 @@ class ResultsDiscussionSeparationRule(Rule):
                 evidence=f"Erkannt: {', '.join(sorted(doc.sections.keys()))}"
             )]
 
-        res_text = res.text.lower()
-        disc_text = disc.text.lower()
-
-        res_hits = [k for k in self.INTERPRETATION_CUES if k in res_text]
-        disc_hits = [k for k in self.INTERPRETATION_CUES if k in disc_text]
+        res_hits = sorted({m.lower() for m in self._CUE_RE.findall(res.text)})
+        disc_hits = sorted({m.lower() for m in self._CUE_RE.findall(disc.text)})
 
         # Heuristik: wenn Ergebnisse sehr viele Interpretationssignale hat, warn
         if len(res_hits) >= 4 and len(disc_hits) >= 2:
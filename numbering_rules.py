@@ -14,6 +14,10 @@ def _norm(s: str) -> str:
     return (s or "").strip().lower()
 
 
+_NUM_ONLY_RE = re.compile(r"^\d+(?:\.\d+)*$")
+_LEADING_NUM_RE = re.compile(r"^\s*(\d+(?:\.\d+)*)(?:\.)?\s+")
+
+
 def _parse_num(num_str: str) -> Optional[Tuple[int, ...]]:
     """
     "1" -> (1,)
@@ -22,7 +26,7 @@ def _parse_num(num_str: str) -> Optional[Tuple[int, ...]]:
     s = (num_str or "").strip()
     if not s:
         return None
-    if not re.match(r"^\d+(?:\.\d+)*$", s):
+    if not _NUM_ONLY_RE.match(s):
         return None
     try:
         return tuple(int(x) for x in s.split("."))
@@ -41,21 +45,37 @@ def _get_heading_number_str(h) -> str:
         return n
 
     txt = (getattr(h, "text", "") or "").strip()
-    m = re.match(r"^\s*(\d+(?:\.\d+)*)(?:\.)?\s+", txt)
+    m = _LEADING_NUM_RE.match(txt)
     if m:
         return m.group(1).rstrip(".")
     return ""
 
 
-def _is_level1(h) -> bool:
-    return int(getattr(h, "level", 0) or 0) == 1
-
+_PARSED_ATTR = "_cache_parsed_headings"
 
-def _is_level2(h) -> bool:
-    return int(getattr(h, "level", 0) or 0) == 2
 
-
-FRONTMATTER_OK = {
+def _parsed_headings(doc) -> Tuple[List[int], List[Optional[Tuple[int, ...]]], list]:
+    """
+    SoA-Sicht auf die Headings: parallele Listen (levels, numbers, headings),
+    einmal pro Dokument geparst. Beide Nummerierungs-Rules lesen nur noch
+    fertige Tupel statt pro Heading erneut Regex + split + int zu machen.
+    """
+    cached = getattr(doc, _PARSED_ATTR, None)
+    if cached is None:
+        hs = getattr(doc, "headings", []) or []
+        # der Extractor garantiert ein int-Level (Fallback 1), also reicht
+        # der direkte Attributzugriff ohne getattr/int/or-Kaskade
+        levels = [h.level for h in hs]
+        numbers = [_parse_num(_get_heading_number_str(h)) for h in hs]
+        cached = (levels, numbers, hs)
+        try:
+            setattr(doc, _PARSED_ATTR, cached)
+        except Exception:
+            pass
+    return cached
+
+
+FRONTMATTER_OK = frozenset({
     "kurzfassung",
     "abstract",
     "danksagung",
@@ -69,24 +89,29 @@ FRONTMATTER_OK = {
     "tabellenverzeichnis",
     "verzeichnis der abbildungen",
     "verzeichnis der tabellen",
-}
+})
 
 
 def _is_frontmatter_heading(h) -> bool:
-    t = _norm(getattr(h, "text", ""))
+    # normalisierten Text am Heading cachen, sonst allokiert jeder
+    # Check einen frischen lower()-String
+    t = getattr(h, "_norm_text", None)
+    if t is None:
+        t = _norm(getattr(h, "text", ""))
+        try:
+            setattr(h, "_norm_text", t)
+        except Exception:
+            pass
     return t in FRONTMATTER_OK
 
 
-def _find_first_chapter1_idx(headings) -> Optional[int]:
+def _find_first_chapter1_idx(levels: List[int], numbers: List[Optional[Tuple[int, ...]]]) -> Optional[int]:
     """
-    Findet die erste Level-1 Überschrift mit Nummer 1.
+    Findet die erste Level-1 Überschrift mit Nummer 1 (auf den bereits
+    geparsten Arrays, kein erneutes Parsen).
     """
-    for i, h in enumerate(headings):
-        if not _is_level1(h):
-            continue
-        n = _get_heading_number_str(h)
-        parts = _parse_num(n)
-        if parts and parts[0] == 1:
+    for i, (lv, n) in enumerate(zip(levels, numbers)):
+        if lv == 1 and n and n[0] == 1:
             return i
     return None
 
@@ -106,7 +131,7 @@ class HeadingsMustBeNumberedRule(Rule):
     severity = "error"
 
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        hs = getattr(doc, "headings", []) or []
+        levels, numbers, hs = _parsed_headings(doc)
         if not hs:
             return [Finding(
                 rule_id=self.id,
@@ -116,7 +141,7 @@ class HeadingsMustBeNumberedRule(Rule):
                 evidence=None
             )]
 
-        first_ch1 = _find_first_chapter1_idx(hs)
+        first_ch1 = _find_first_chapter1_idx(levels, numbers)
         if first_ch1 is None:
             return [Finding(
                 rule_id=self.id,
@@ -126,15 +151,12 @@ class HeadingsMustBeNumberedRule(Rule):
                 evidence="Tipp: Kapitel 1 muss als Überschrift (Heading/Überschrift 1) formatiert sein."
             )]
 
-        front = hs[:first_ch1]
-        body = hs[first_ch1:]
-
         # Frontmatter: wenn unnummeriert und NICHT frontmatter-typisch => warn (nicht error)
         illegal_front = [
-            h for h in front
-            if _is_level1(h)
-            and (_parse_num(_get_heading_number_str(h)) is None)
-            and (not _is_frontmatter_heading(h))
+            hs[i] for i in range(first_ch1)
+            if levels[i] == 1
+            and numbers[i] is None
+            and (not _is_frontmatter_heading(hs[i]))
         ]
         if illegal_front:
             examples = ", ".join((getattr(h, "text", "") or "").strip() for h in illegal_front[:8])
@@ -148,8 +170,8 @@ class HeadingsMustBeNumberedRule(Rule):
 
         # Body: Level-1 müssen nummeriert sein
         unnumbered_body = [
-            h for h in body
-            if _is_level1(h) and (_parse_num(_get_heading_number_str(h)) is None)
+            hs[i] for i in range(first_ch1, len(hs))
+            if levels[i] == 1 and numbers[i] is None
         ]
         if unnumbered_body:
             examples = ", ".join((getattr(h, "text", "") or "").strip() for h in unnumbered_body[:8])
@@ -185,7 +207,7 @@ class HeadingNumberingNoGapsRule(Rule):
     severity = "error"
 
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        hs = getattr(doc, "headings", []) or []
+        levels, numbers, hs = _parsed_headings(doc)
         if not hs:
             return [Finding(
                 rule_id=self.id,
@@ -195,17 +217,16 @@ class HeadingNumberingNoGapsRule(Rule):
                 evidence=None
             )]
 
-        # Sammle nummerierte Level 1 & 2
+        # Sammle nummerierte Level 1 & 2 (bereits geparst, kein Regex mehr hier)
         lvl1 = []
         lvl2 = []
 
-        for h in hs:
-            n = _parse_num(_get_heading_number_str(h))
+        for lv, n, h in zip(levels, numbers, hs):
             if not n:
                 continue
-            if _is_level1(h):
+            if lv == 1:
                 lvl1.append((n, h))
-            elif _is_level2(h):
+            elif lv == 2:
                 lvl2.append((n, h))
 
         if not lvl1 and not lvl2:
@@ -219,10 +240,10 @@ class HeadingNumberingNoGapsRule(Rule):
 
         problems: List[str] = []
 
-        # Level 1: erwartet 1,2,3...
-        lvl1_sorted = sorted(lvl1, key=lambda x: x[0])
+        # Level 1: erwartet 1,2,3... – in Dokument-Reihenfolge prüfen;
+        # ein Sortieren würde falsch angeordnete Nummern gerade verstecken
         expected = 1
-        for num, h in lvl1_sorted:
+        for num, h in lvl1:
             if len(num) < 1:
                 continue
             if num[0] != expected:
@@ -231,24 +252,20 @@ class HeadingNumberingNoGapsRule(Rule):
             else:
                 expected += 1
 
-        # Level 2: pro Kapitel X erwartet X.1, X.2, ...
-        per_chapter = {}
+        # Level 2: pro Kapitel X erwartet X.1, X.2, ... – ein Durchlauf,
+        # pro Kapitel wird nur der nächste erwartete Wert gehalten
+        # (kein dict-of-lists mehr); angezeigt werden eh max. 6 Probleme
+        exp_per_chapter: dict = {}
         for num, h in lvl2:
-            if len(num) >= 2:
-                ch = num[0]
-                per_chapter.setdefault(ch, []).append((num, h))
-
-        for ch, items in per_chapter.items():
-            items_sorted = sorted(items, key=lambda x: x[0])
-            exp = 1
-            for num, h in items_sorted:
-                if num[0] != ch:
-                    continue
-                if num[1] != exp:
-                    problems.append(f"Level2 in Kapitel {ch} erwartet {ch}.{exp}, gefunden {ch}.{num[1]} ('{getattr(h,'text','')[:40]}')")
-                    exp = num[1] + 1
-                else:
-                    exp += 1
+            if len(num) < 2:
+                continue
+            ch = num[0]
+            want = exp_per_chapter.get(ch, 1)
+            if num[1] != want:
+                problems.append(f"Level2 in Kapitel {ch} erwartet {ch}.{want}, gefunden {ch}.{num[1]} ('{getattr(h,'text','')[:40]}')")
+            exp_per_chapter[ch] = num[1] + 1
+            if len(problems) >= 7:
+                break
 
         if problems:
             return [Finding(
@@ -1,5 +1,13 @@
-from typing import List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import List, Optional
+
+from . import doc_cache
 from .base import Rule
+from .text_norm import norm_title
+from ..models.document_model import DocumentModel, AIAnnotations
+from ..models.findings import Finding
 
 from .structure_rules import RequiredChaptersRule
 from .structure_quality_rules import ChapterOrderPlausibleRule, ChapterLengthBalancedRule
@@ -30,38 +38,126 @@ from .numbering_rules import HeadingsMustBeNumberedRule, HeadingNumberingNoGapsR
 
 
 
+# Rules sind stateless -> einmal beim Import instanziieren statt
+# pro Aufruf ~24 frische Objekte zu bauen
+_ALL_RULES = (
+    RequiredChaptersRule(),
+    TableOfContentsExistsRule(),          # STRUCT-015
+
+    HeadingHierarchyRule(),
+    HeadingDepthRule(),
+
+    HeadingsMustBeNumberedRule(),         # FORM-041a
+    HeadingNumberingNoGapsRule(),         # FORM-041b
+
+    ResearchQuestionExistsRule(),
+    ResearchQuestionInIntroRule(),
+    ResearchKeyTermsConsistencyRule(),
+    ResearchQuestionReferencedInResultsRule(),
+    ResearchQuestionReferencedInDiscussionRule(),
+
+    ChapterOrderPlausibleRule(),
+    ChapterLengthBalancedRule(),
+
+    MethodChapterExistsRule(),
+    MethodDetailSufficientRule(),
+    ResultsDiscussionSeparationRule(),
+
+    LiteratureExistsRule(),
+    AllCitationsInReferenceListRule(),
+    NoUncitedReferencesRule(),
+    CitationStyleConsistentRule(),
+
+    ListOfFiguresExistsRule(),            # FORM-039 (pflicht wenn Abbildungen)
+    ListOfTablesExistsRule(),             # FORM-040 (pflicht wenn Tabellen)
+
+    FiguresTablesReferencedRule(),
+)
+
+
 def get_all_rules() -> List[Rule]:
-    return [
-        RequiredChaptersRule(),
-        TableOfContentsExistsRule(),          # STRUCT-015
+    # Liste zurückgeben, falls Caller die Sammlung anfassen wollen
+    return list(_ALL_RULES)
+
+
+class RuleCache:
+    """
+    Memoisiert Rule-Ergebnisse über den Dokument-Fingerprint: wird
+    dasselbe unveränderte Dokument erneut geprüft (Editor-Save-Loop,
+    Batch-Rechecks), kommen die Findings aus einem Dict-Lookup statt
+    aus erneuten Volltext-Scans. Der Key ist inhaltsbasiert
+    (doc_cache.fingerprint), Mutationen am Dokument ändern also den
+    Fingerprint und invalidieren automatisch.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._store: dict = {}
+
+    def get(self, rule_id: str, fp: str) -> Optional[List[Finding]]:
+        return self._store.get((rule_id, fp))
+
+    def put(self, rule_id: str, fp: str, findings: List[Finding]) -> None:
+        # simpel: bei Überlauf alles verwerfen statt LRU-Buchhaltung
+        if len(self._store) >= self._maxsize:
+            self._store.clear()
+        self._store[(rule_id, fp)] = findings
+
+
+def run_all_rules(doc: DocumentModel, ai: Optional[AIAnnotations] = None,
+                  executor=None, cache: Optional[RuleCache] = None) -> List[Finding]:
+    """
+    Führt alle Rules gegen ein Dokument aus.
+
+    Optional kann ein Executor übergeben werden (z.B. ein
+    concurrent.futures.ThreadPoolExecutor): die Rules sind unabhängige
+    Read-only-Pässe über das DocumentModel und laufen dann parallel.
+    Die Reihenfolge der Findings entspricht in allen Fällen _ALL_RULES.
 
-        HeadingHierarchyRule(),
-        HeadingDepthRule(),
+    Mit einem RuleCache werden Ergebnisse pro (Rule, Dokument-Fingerprint)
+    memoisiert; KI-Läufe (ai gesetzt) umgehen den Cache, weil die
+    Annotationen nicht im Fingerprint stecken. Cache-Treffer sind
+    O(1), deshalb läuft der Cache-Pfad seriell.
+    """
+    if cache is not None and ai is None:
+        fp = doc_cache.fingerprint(doc)
+        findings: List[Finding] = []
+        for rule in _ALL_RULES:
+            cached = cache.get(rule.id, fp)
+            if cached is None:
+                cached = rule.run(doc, ai)
+                cache.put(rule.id, fp, cached)
+            findings.extend(cached)
+        return findings
 
-        HeadingsMustBeNumberedRule(),         # FORM-041a
-        HeadingNumberingNoGapsRule(),         # FORM-041b
+    if executor is None:
+        findings = []
+        for rule in _ALL_RULES:
+            findings.extend(rule.run(doc, ai))
+        return findings
 
-        ResearchQuestionExistsRule(),
-        ResearchQuestionInIntroRule(),
-        ResearchKeyTermsConsistencyRule(),
-        ResearchQuestionReferencedInResultsRule(),
-        ResearchQuestionReferencedInDiscussionRule(),
+    futures = [executor.submit(rule.run, doc, ai) for rule in _ALL_RULES]
+    return list(chain.from_iterable(f.result() for f in futures))
 
-        ChapterOrderPlausibleRule(),
-        ChapterLengthBalancedRule(),
 
-        MethodChapterExistsRule(),
-        MethodDetailSufficientRule(),
-        ResultsDiscussionSeparationRule(),
+def run_all_rules_parallel(doc: DocumentModel, ai: Optional[AIAnnotations] = None,
+                           max_workers: Optional[int] = None,
+                           cache: Optional[RuleCache] = None) -> List[Finding]:
+    """
+    Komfort-Wrapper um run_all_rules mit eigenem Thread-Pool.
 
-        LiteratureExistsRule(),
-        AllCitationsInReferenceListRule(),
-        NoUncitedReferencesRule(),
-        CitationStyleConsistentRule(),
+    Die geteilten pro-Dokument-Caches werden vorher im Hauptthread
+    aufgewärmt, damit die Worker nicht dieselben Zwischenergebnisse
+    parallel doppelt berechnen (die attribut-basierten Caches sind ohne
+    Lock: doppelte Berechnung wäre korrekt, aber verschenkte Arbeit).
+    """
+    if cache is not None and ai is None:
+        # Cache-Pfad ist seriell, Treffer sind eh O(1)
+        return run_all_rules(doc, ai, cache=cache)
 
-        ListOfFiguresExistsRule(),            # FORM-039 (pflicht wenn Abbildungen)
-        ListOfTablesExistsRule(),             # FORM-040 (pflicht wenn Tabellen)
+    doc_cache.full_text(doc)
+    doc_cache.section_title_index(doc, norm_title)
 
-        FiguresTablesReferencedRule(),
-    ]
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return run_all_rules(doc, ai, executor=executor)
 
@@ -1,413 +1,506 @@
-import re
-import unicodedata
-from collections import Counter
-from typing import List, Optional
-
-from .base import Rule
-from ..models.document_model import DocumentModel, AIAnnotations
-from ..models.findings import Finding
-
-
-# -----------------------------
-# Konfiguration / Patterns
-# -----------------------------
-
-STOPWORDS_DE = {
-    "der", "die", "das", "ein", "eine", "einer", "eines", "einem", "einen",
-    "und", "oder", "aber", "sowie", "als", "wie", "wenn", "dann", "dass", "daß",
-    "ist", "sind", "war", "waren", "wird", "werden", "wurde",
-    "in", "im", "auf", "an", "am", "aus", "bei", "mit", "ohne", "für", "von", "zu", "zum", "zur",
-    "des", "den", "dem", "durch", "über", "unter", "zwischen", "gegen", "um",
-    "diese", "dieser", "dieses", "diesem", "diesen",
-    "arbeit", "bachelorarbeit", "studie", "untersuchung", "analyse",
-    "frage", "forschungsfrage", "ziel", "zielsetzung",
-}
-
-# Heuristische Muster für Forschungsfrage / Zielsetzung
-RQ_PATTERNS = [
-    r"\bforschungsfrage\b",
-    r"\bfragestellung\b",
-    r"\bziel dieser arbeit\b",
-    r"\bzielsetzung\b",
-    r"\bdiese arbeit untersucht\b",
-    r"\bdiese arbeit analysiert\b",
-    r"\bdiese arbeit geht der frage nach\b",
-    r"\bfolgende frage\b",
-    r"\bim rahmen dieser arbeit\b.*\bfrage\b",
-]
-
-
-# -----------------------------
-# Helper-Funktionen
-# -----------------------------
-
-def _contains_research_question(text: str) -> bool:
-    return any(re.search(p, text, flags=re.IGNORECASE) for p in RQ_PATTERNS)
-
-
-def _normalize(s: str) -> str:
-    s = s.lower().strip()
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
-    # verschiedene Bindestriche -> "-"
-    s = re.sub(r"[\u2010\u2011\u2012\u2013\u2014]", "-", s)
-    s = re.sub(r"[^a-z0-9äöüß\- ]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-
-def _tokenize(text: str) -> List[str]:
-    t = _normalize(text)
-    return re.findall(r"[a-zäöüß0-9\-]{2,}", t)
-
-
-def _extract_candidate_terms(rq_text: str, max_terms: int = 8) -> List[str]:
-    """
-    V1: Kandidaten aus der Forschungsfrage:
-    - Tokenize
-    - Stopwords raus
-    - Häufigkeit / Länge als Signal
-    """
-    tokens = [t for t in _tokenize(rq_text) if t not in STOPWORDS_DE and len(t) >= 3]
-    if not tokens:
-        return []
-
-    counts = Counter(tokens)
-
-    def score(tok: str) -> float:
-        # häufig + länger = wichtiger (heuristisch)
-        return counts[tok] * 2 + min(len(tok), 12) / 4
-
-    ranked = sorted(counts.keys(), key=lambda x: score(x), reverse=True)
-    return ranked[:max_terms]
-
-
-def _find_variants(text_tokens: List[str], term: str) -> List[str]:
-    """
-    Findet "ähnliche" Varianten:
-    - gleiche Basis ohne '-' (e.g. "data-driven" vs "datadriven")
-    - simple singular/plural Heuristik
-    """
-    base_term = term.replace("-", "")
-
-    variants = set()
-    for t in text_tokens:
-        if t == term:
-            continue
-
-        if t.replace("-", "") == base_term:
-            variants.add(t)
-
-        # simple plural/singular heuristics
-        if t.startswith(term) or term.startswith(t):
-            if abs(len(t) - len(term)) <= 3:
-                variants.add(t)
-
-    return sorted(variants)[:8]
-
-
-# -----------------------------
-# Rules
-# -----------------------------
-
-class ResearchQuestionExistsRule(Rule):
-    """
-    Check Nr. 1: Forschungsfrage explizit vorhanden
-    """
-    id = "RQ-001"
-    category = "Fragestellung"
-    severity = "error"
-
-    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        full_text = "\n".join(doc.paragraphs)
-
-        if _contains_research_question(full_text):
-            # Evidence: erste passende Zeile
-            for p in doc.paragraphs:
-                if _contains_research_question(p):
-                    return [Finding(
-                        rule_id=self.id,
-                        category=self.category,
-                        severity="info",
-                        message="Hinweis auf Forschungsfrage/Zielsetzung gefunden.",
-                        evidence=p[:220]
-                    )]
-
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="info",
-                message="Hinweis auf Forschungsfrage/Zielsetzung gefunden.",
-                evidence=None
-            )]
-
-        return [Finding(
-            rule_id=self.id,
-            category=self.category,
-            severity="error",
-            message="Keine explizite Forschungsfrage/Zielsetzung gefunden (heuristisch).",
-            evidence="Gesucht wurden Muster wie: 'Forschungsfrage', 'Ziel dieser Arbeit', 'Diese Arbeit untersucht ...'"
-        )]
-
-
-class ResearchQuestionInIntroRule(Rule):
-    """
-    Check Nr. 2: Forschungsfrage steht in der Einleitung
-    V1-Heuristik: Wenn wir eine 'einleitung' Section haben, prüfen wir darin.
-    """
-    id = "RQ-002"
-    category = "Fragestellung"
-    severity = "warn"
-
-    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        intro = doc.sections.get("einleitung")
-
-        if intro is None:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message="Einleitung nicht erkannt – Check 'RQ in Einleitung' kann nicht sauber geprüft werden.",
-                evidence="Tipp: Überschrift 'Einleitung' als echte Überschrift formatieren oder nummerieren (z.B. '1 Einleitung')."
-            )]
-
-        if _contains_research_question(intro.text):
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="info",
-                message="Hinweis auf Forschungsfrage/Zielsetzung in der Einleitung gefunden (heuristisch).",
-                evidence=f"Section: {intro.title}"
-            )]
-
-        return [Finding(
-            rule_id=self.id,
-            category=self.category,
-            severity="warn",
-            message="Kein Hinweis auf Forschungsfrage/Zielsetzung in der Einleitung gefunden (heuristisch).",
-            evidence=f"Section: {intro.title}"
-        )]
-
-
-class ResearchKeyTermsConsistencyRule(Rule):
-    """
-    Check Nr. 3: Zentrale Begriffe der Forschungsfrage konsistent verwendet (V1 heuristisch)
-
-    Vorgehen:
-    - RQ/Ziel-Passage bestimmen (oder später ai.research_question)
-    - Key Terms daraus extrahieren
-    - prüfen ob Terms im Dokument vorkommen
-    - prüfen ob auffällige Varianten existieren (Bindestrich / sehr ähnlich)
-    """
-    id = "RQ-003"
-    category = "Fragestellung"
-    severity = "warn"
-
-    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        full_text = "\n".join(doc.paragraphs)
-        tokens = _tokenize(full_text)
-
-        # 1) RQ-Quelle bestimmen
-        rq_source = None
-
-        # später: KI kann das direkt liefern
-        if ai and ai.research_question:
-            rq_source = ai.research_question
-        else:
-            for p in doc.paragraphs:
-                if _contains_research_question(p):
-                    rq_source = p
-                    break
-
-        if not rq_source:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message="Keine Forschungsfrage/Ziel-Passage gefunden – zentrale Begriffe können nicht extrahiert werden.",
-                evidence="Tipp: Formuliere einen Satz wie „Die Forschungsfrage lautet: …“ oder „Ziel dieser Arbeit ist …“"
-            )]
-
-        terms = _extract_candidate_terms(rq_source, max_terms=8)
-        if not terms:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message="Konnte keine zentralen Begriffe aus der Forschungsfrage ableiten (heuristisch).",
-                evidence=f"RQ-Text: {rq_source[:200]}"
-            )]
-
-        # 2) Vorkommen prüfen
-        missing = [t for t in terms if t not in tokens]
-        if missing:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message=f"Einige zentrale Begriffe aus der Forschungsfrage tauchen im Text nicht auf: {', '.join(missing)}",
-                evidence=f"Extrahierte Begriffe: {', '.join(terms)}"
-            )]
-
-        # 3) Varianten prüfen
-        variants_map = {}
-        for t in terms:
-            vars_ = _find_variants(tokens, t)
-            if vars_:
-                variants_map[t] = vars_
-
-        if variants_map:
-            parts = [f"{k} → {', '.join(v)}" for k, v in variants_map.items()]
-            evidence = " | ".join(parts)[:350]
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message="Mögliche inkonsistente Schreibweisen zentraler Begriffe gefunden (heuristisch).",
-                evidence=evidence
-            )]
-
-        return [Finding(
-            rule_id=self.id,
-            category=self.category,
-            severity="info",
-            message="Zentrale Begriffe aus der Forschungsfrage erscheinen konsistent (heuristisch).",
-            evidence=f"Begriffe: {', '.join(terms)}"
-    
-        )]
-class ResearchQuestionReferencedInResultsRule(Rule):
-    """
-    Check Nr. 4: Forschungsfrage wird im Ergebnisteil referenziert (heuristisch)
-    V1: Keywords aus RQ-Quelle extrahieren und in 'ergebnisse' Section suchen.
-    """
-    id = "RQ-004"
-    category = "Fragestellung"
-    severity = "warn"
-
-    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        results = doc.sections.get("ergebnisse")
-        if results is None:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message="Ergebnisse-Kapitel nicht erkannt – Check RQ-004 kann nicht sauber geprüft werden.",
-                evidence="Tipp: Überschrift als 'Ergebnisse' oder '4 Ergebnisse' formatieren/nummerieren."
-            )]
-
-        # RQ-Quelle bestimmen (wie in RQ-003)
-        rq_source = ai.research_question if (ai and ai.research_question) else None
-        if not rq_source:
-            for p in doc.paragraphs:
-                if _contains_research_question(p):
-                    rq_source = p
-                    break
-
-        if not rq_source:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message="Keine Forschungsfrage/Ziel-Passage gefunden – kann Rückbezug in Ergebnissen nicht prüfen.",
-                evidence=None
-            )]
-
-        terms = _extract_candidate_terms(rq_source, max_terms=8)
-        if not terms:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message="Keine zentralen Begriffe aus der Forschungsfrage ableitbar – Check RQ-004 übersprungen.",
-                evidence=f"RQ-Text: {rq_source[:200]}"
-            )]
-
-        results_tokens = set(_tokenize(results.text))
-        hits = [t for t in terms if t in results_tokens]
-
-        # Heuristik: mindestens 2 Treffer oder mindestens 35% der Terms
-        needed = max(2, int(len(terms) * 0.35))
-        if len(hits) >= needed:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="info",
-                message="Rückbezug auf zentrale Begriffe der Forschungsfrage im Ergebnisteil gefunden (heuristisch).",
-                evidence=f"Treffer: {', '.join(hits)}"
-            )]
-
-        return [Finding(
-            rule_id=self.id,
-            category=self.category,
-            severity="warn",
-            message="Wenig/kein Rückbezug auf zentrale Begriffe der Forschungsfrage im Ergebnisteil (heuristisch).",
-            evidence=f"Treffer: {', '.join(hits) or 'keine'} | Begriffe: {', '.join(terms)}"
-        )]
-
-
-class ResearchQuestionReferencedInDiscussionRule(Rule):
-    """
-    Check Nr. 5: Forschungsfrage wird in der Diskussion referenziert (heuristisch)
-    V1: Keywords aus RQ-Quelle extrahieren und in 'diskussion' Section suchen.
-    """
-    id = "RQ-005"
-    category = "Fragestellung"
-    severity = "warn"
-
-    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        discussion = doc.sections.get("diskussion")
-        if discussion is None:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message="Diskussion-Kapitel nicht erkannt – Check RQ-005 kann nicht sauber geprüft werden.",
-                evidence="Tipp: Überschrift als 'Diskussion' oder '5 Diskussion' formatieren/nummerieren."
-            )]
-
-        rq_source = ai.research_question if (ai and ai.research_question) else None
-        if not rq_source:
-            for p in doc.paragraphs:
-                if _contains_research_question(p):
-                    rq_source = p
-                    break
-
-        if not rq_source:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message="Keine Forschungsfrage/Ziel-Passage gefunden – kann Rückbezug in Diskussion nicht prüfen.",
-                evidence=None
-            )]
-
-        terms = _extract_candidate_terms(rq_source, max_terms=8)
-        if not terms:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="warn",
-                message="Keine zentralen Begriffe aus der Forschungsfrage ableitbar – Check RQ-005 übersprungen.",
-                evidence=f"RQ-Text: {rq_source[:200]}"
-            )]
-
-        disc_tokens = set(_tokenize(discussion.text))
-        hits = [t for t in terms if t in disc_tokens]
-
-        needed = max(2, int(len(terms) * 0.35))
-        if len(hits) >= needed:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="info",
-                message="Rückbezug auf zentrale Begriffe der Forschungsfrage in der Diskussion gefunden (heuristisch).",
-                evidence=f"Treffer: {', '.join(hits)}"
-            )]
-
-        return [Finding(
-            rule_id=self.id,
-            category=self.category,
-            severity="warn",
-            message="Wenig/kein Rückbezug auf zentrale Begriffe der Forschungsfrage in der Diskussion (heuristisch).",
-            evidence=f"Treffer: {', '.join(hits) or 'keine'} | Begriffe: {', '.join(terms)}"
-        )]
+import functools
+import heapq
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import List, Optional, Tuple
+
+from .base import Rule
+from . import doc_cache
+from ..models.document_model import DocumentModel, AIAnnotations
+from ..models.findings import Finding
+
+
+# -----------------------------
+# Konfiguration / Patterns
+# -----------------------------
+
+STOPWORDS_DE = {
+    "der", "die", "das", "ein", "eine", "einer", "eines", "einem", "einen",
+    "und", "oder", "aber", "sowie", "als", "wie", "wenn", "dann", "dass", "daß",
+    "ist", "sind", "war", "waren", "wird", "werden", "wurde",
+    "in", "im", "auf", "an", "am", "aus", "bei", "mit", "ohne", "für", "von", "zu", "zum", "zur",
+    "des", "den", "dem", "durch", "über", "unter", "zwischen", "gegen", "um",
+    "diese", "dieser", "dieses", "diesem", "diesen",
+    "arbeit", "bachelorarbeit", "studie", "untersuchung", "analyse",
+    "frage", "forschungsfrage", "ziel", "zielsetzung",
+}
+
+# Heuristische Muster für Forschungsfrage / Zielsetzung
+RQ_PATTERNS = [
+    r"\bforschungsfrage\b",
+    r"\bfragestellung\b",
+    r"\bziel dieser arbeit\b",
+    r"\bzielsetzung\b",
+    r"\bdiese arbeit untersucht\b",
+    r"\bdiese arbeit analysiert\b",
+    r"\bdiese arbeit geht der frage nach\b",
+    r"\bfolgende frage\b",
+    r"\bim rahmen dieser arbeit\b.*\bfrage\b",
+]
+
+# alle RQ-Muster als eine Alternation: ein Scan pro Text statt 9
+_RQ_RE = re.compile("|".join(f"(?:{p})" for p in RQ_PATTERNS), re.IGNORECASE)
+
+# Normalisierungs-/Tokenizer-Patterns einmal kompilieren (heisser Pfad);
+# nach NFKD + Combining-Strip sind Umlaute schon zu a/o/u zerlegt,
+# nur ß überlebt lower() -> die Zeichenklassen brauchen kein äöü mehr
+_DASH_RE = re.compile(r"[\u2010\u2011\u2012\u2013\u2014]")
+_NONALNUM_RE = re.compile(r"[^a-z0-9ß\- ]+")
+_WS_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"[a-z0-9ß\-]{2,}")
+
+# Combining-Marks (die vier Blöcke, die nach NFKD in Latin-Text vorkommen)
+# als translate-Tabelle -> ein C-Loop statt unicodedata.combining() pro Zeichen
+_COMBINING_TABLE = {cp: None for cp in range(0x0300, 0x0370)}
+_COMBINING_TABLE.update((cp, None) for cp in range(0x1DC0, 0x1E00))
+_COMBINING_TABLE.update((cp, None) for cp in range(0x20D0, 0x2100))
+_COMBINING_TABLE.update((cp, None) for cp in range(0xFE20, 0xFE30))
+
+
+# -----------------------------
+# Helper-Funktionen
+# -----------------------------
+
+def _contains_research_question(text: str) -> bool:
+    return _RQ_RE.search(text) is not None
+
+
+def _normalize(s: str) -> str:
+    s = s.lower().strip()
+    # reiner ASCII-Text hat weder Umlaute noch Combining-Marks noch
+    # typografische Bindestriche -> NFKD + translate komplett sparen
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s)
+        s = s.translate(_COMBINING_TABLE)
+        # verschiedene Bindestriche -> "-"
+        s = _DASH_RE.sub("-", s)
+    s = _NONALNUM_RE.sub(" ", s)
+    s = _WS_RE.sub(" ", s).strip()
+    return s
+
+
+def _iter_tokens(text: str):
+    """Tokens als Generator – für reine Set-Aufbauten spart das die
+    Zwischenliste über alle Dokument-Tokens."""
+    t = _normalize(text)
+    for m in _TOKEN_RE.finditer(t):
+        yield m.group()
+
+
+def _tokenize(text: str) -> List[str]:
+    return list(_iter_tokens(text))
+
+
+def _extract_candidate_terms(rq_text: str, max_terms: int = 8) -> List[str]:
+    """
+    V1: Kandidaten aus der Forschungsfrage:
+    - Tokenize
+    - Stopwords raus
+    - Häufigkeit / Länge als Signal
+    """
+    tokens = [t for t in _tokenize(rq_text) if t not in STOPWORDS_DE and len(t) >= 3]
+    if not tokens:
+        return []
+
+    counts = Counter(tokens)
+
+    # häufig + länger = wichtiger (heuristisch); nlargest statt Vollsortierung
+    # und der Score rechnet direkt auf den items (kein counts-Lookup pro Vergleich)
+    top = heapq.nlargest(
+        max_terms,
+        counts.items(),
+        key=lambda kv: kv[1] * 2 + min(len(kv[0]), 12) / 4,
+    )
+    return [tok for tok, _ in top]
+
+
+# leichte deutsche Flexions-Endungen, längste zuerst; mehr als Snowball
+# Step 1 brauchen wir hier nicht (wir vergleichen nur Token untereinander,
+# der Stamm muss kein echtes Wort sein)
+_STEM_SUFFIXES = ("ungen", "ung", "ern", "en", "em", "er", "es", "e", "n", "s")
+
+
+def _stem_de(token: str) -> str:
+    """
+    Sehr leichter deutscher Stemmer: streift bis zu zwei typische
+    Flexionsendungen ab, solange mindestens 4 Zeichen Stamm übrig bleiben.
+    "fragen" -> "frag", "untersuchungen" -> "untersuch", "analyse" -> "analys".
+    """
+    for _ in range(2):
+        for suf in _STEM_SUFFIXES:
+            if token.endswith(suf) and len(token) - len(suf) >= 4:
+                token = token[: -len(suf)]
+                break
+        else:
+            break
+    return token
+
+
+def _find_variants(ctx: "_RQContext", term: str) -> List[str]:
+    """
+    Findet "ähnliche" Varianten:
+    - gleiche Basis ohne '-' (e.g. "data-driven" vs "datadriven")
+    - gleicher Stamm nach leichtem Suffix-Stripping ("frage"/"fragen")
+
+    Läuft über die vorberechneten Indizes im _RQContext: O(1) pro Begriff
+    statt Prefix-Walks über das ganze Vokabular, und der Stammvergleich
+    trifft auch Paare wie "analyse"/"analysen", die die alte
+    Längendifferenz-Heuristik verfehlt hat.
+    """
+    base_term = term.replace("-", "")
+    variants = set(ctx.dash_index.get(base_term, ()))
+    variants.update(ctx.stem_index.get(_stem_de(term), ()))
+
+    variants.discard(term)
+    # nur die 8 kleinsten statt Vollsortierung + Slice
+    return heapq.nsmallest(8, variants)
+
+
+# -----------------------------
+# Geteilter RQ-Kontext pro Dokument
+# -----------------------------
+
+_RQ_CTX_ATTR = "_cache_rq_context"
+
+
+class _RQContext:
+    """
+    Gemeinsamer Zustand der RQ-Rules: RQ-Passage, extrahierte Begriffe und
+    Volltext-Tokens werden pro Dokument nur einmal berechnet (RQ-003/004/005
+    fragen alle dasselbe ab). Alles lazy – ein Dokument ohne RQ-Passage
+    wird z.B. nie tokenisiert.
+    """
+
+    def __init__(self, doc: DocumentModel):
+        self._doc = doc
+
+    @functools.cached_property
+    def rq_source(self) -> Optional[str]:
+        for p in self._doc.paragraphs:
+            if _contains_research_question(p):
+                return p
+        return None
+
+    @functools.cached_property
+    def terms(self) -> List[str]:
+        if not self.rq_source:
+            return []
+        return _extract_candidate_terms(self.rq_source, max_terms=8)
+
+    @functools.cached_property
+    def token_set(self) -> set:
+        # direkt ins Set streamen, die Token-Liste braucht niemand
+        return set(_iter_tokens(doc_cache.full_text(self._doc)))
+
+    @functools.cached_property
+    def sorted_unique_tokens(self) -> List[str]:
+        return sorted(self.token_set)
+
+    @functools.cached_property
+    def dash_index(self) -> defaultdict:
+        """Vokabular nach Bindestrich-bereinigter Basis gruppiert."""
+        idx = defaultdict(list)
+        for t in self.sorted_unique_tokens:
+            idx[t.replace("-", "")].append(t)
+        return idx
+
+    @functools.cached_property
+    def stem_index(self) -> defaultdict:
+        """Vokabular nach leichtem deutschen Stamm gruppiert."""
+        idx = defaultdict(list)
+        for t in self.sorted_unique_tokens:
+            idx[_stem_de(t)].append(t)
+        return idx
+
+    def source_and_terms(self, ai: Optional[AIAnnotations]) -> Tuple[Optional[str], List[str]]:
+        """KI-Antwort (falls vorhanden) gewinnt; sonst die gecachte Heuristik."""
+        if ai and ai.research_question:
+            rq = ai.research_question
+            return rq, _extract_candidate_terms(rq, max_terms=8)
+        return self.rq_source, self.terms
+
+
+def _rq_context(doc: DocumentModel) -> _RQContext:
+    ctx = getattr(doc, _RQ_CTX_ATTR, None)
+    if ctx is None:
+        ctx = _RQContext(doc)
+        try:
+            setattr(doc, _RQ_CTX_ATTR, ctx)
+        except Exception:
+            pass
+    return ctx
+
+
+# -----------------------------
+# Rules
+# -----------------------------
+
+class ResearchQuestionExistsRule(Rule):
+    """
+    Check Nr. 1: Forschungsfrage explizit vorhanden
+    """
+    id = "RQ-001"
+    category = "Fragestellung"
+    severity = "error"
+
+    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
+        # ein Paragraph-Scan (geteilt mit RQ-003/004/005) statt
+        # Volltext-Scan + nochmal Paragraph-Scan für die Evidence
+        rq_source = _rq_context(doc).rq_source
+        if rq_source is not None:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="info",
+                message="Hinweis auf Forschungsfrage/Zielsetzung gefunden.",
+                evidence=rq_source[:220]
+            )]
+
+        return [Finding(
+            rule_id=self.id,
+            category=self.category,
+            severity="error",
+            message="Keine explizite Forschungsfrage/Zielsetzung gefunden (heuristisch).",
+            evidence="Gesucht wurden Muster wie: 'Forschungsfrage', 'Ziel dieser Arbeit', 'Diese Arbeit untersucht ...'"
+        )]
+
+
+class ResearchQuestionInIntroRule(Rule):
+    """
+    Check Nr. 2: Forschungsfrage steht in der Einleitung
+    V1-Heuristik: Wenn wir eine 'einleitung' Section haben, prüfen wir darin.
+    """
+    id = "RQ-002"
+    category = "Fragestellung"
+    severity = "warn"
+
+    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
+        intro = doc.sections.get("einleitung")
+
+        if intro is None:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message="Einleitung nicht erkannt – Check 'RQ in Einleitung' kann nicht sauber geprüft werden.",
+                evidence="Tipp: Überschrift 'Einleitung' als echte Überschrift formatieren oder nummerieren (z.B. '1 Einleitung')."
+            )]
+
+        if _contains_research_question(intro.text):
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="info",
+                message="Hinweis auf Forschungsfrage/Zielsetzung in der Einleitung gefunden (heuristisch).",
+                evidence=f"Section: {intro.title}"
+            )]
+
+        return [Finding(
+            rule_id=self.id,
+            category=self.category,
+            severity="warn",
+            message="Kein Hinweis auf Forschungsfrage/Zielsetzung in der Einleitung gefunden (heuristisch).",
+            evidence=f"Section: {intro.title}"
+        )]
+
+
+class ResearchKeyTermsConsistencyRule(Rule):
+    """
+    Check Nr. 3: Zentrale Begriffe der Forschungsfrage konsistent verwendet (V1 heuristisch)
+
+    Vorgehen:
+    - RQ/Ziel-Passage bestimmen (oder später ai.research_question)
+    - Key Terms daraus extrahieren
+    - prüfen ob Terms im Dokument vorkommen
+    - prüfen ob auffällige Varianten existieren (Bindestrich / sehr ähnlich)
+    """
+    id = "RQ-003"
+    category = "Fragestellung"
+    severity = "warn"
+
+    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
+        ctx = _rq_context(doc)
+
+        # 1) RQ-Quelle bestimmen (KI-Antwort gewinnt, sonst Cache)
+        rq_source, terms = ctx.source_and_terms(ai)
+
+        if not rq_source:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message="Keine Forschungsfrage/Ziel-Passage gefunden – zentrale Begriffe können nicht extrahiert werden.",
+                evidence="Tipp: Formuliere einen Satz wie „Die Forschungsfrage lautet: …“ oder „Ziel dieser Arbeit ist …“"
+            )]
+
+        if not terms:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message="Konnte keine zentralen Begriffe aus der Forschungsfrage ableiten (heuristisch).",
+                evidence=f"RQ-Text: {rq_source[:200]}"
+            )]
+
+        # 2) Vorkommen prüfen (Set-Membership statt Scan über die Token-Liste)
+        missing = [t for t in terms if t not in ctx.token_set]
+        if missing:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message=f"Einige zentrale Begriffe aus der Forschungsfrage tauchen im Text nicht auf: {', '.join(missing)}",
+                evidence=f"Extrahierte Begriffe: {', '.join(terms)}"
+            )]
+
+        # 3) Varianten prüfen
+        variants_map = {}
+        for t in terms:
+            vars_ = _find_variants(ctx, t)
+            if vars_:
+                variants_map[t] = vars_
+
+        if variants_map:
+            parts = [f"{k} → {', '.join(v)}" for k, v in variants_map.items()]
+            evidence = " | ".join(parts)[:350]
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message="Mögliche inkonsistente Schreibweisen zentraler Begriffe gefunden (heuristisch).",
+                evidence=evidence
+            )]
+
+        return [Finding(
+            rule_id=self.id,
+            category=self.category,
+            severity="info",
+            message="Zentrale Begriffe aus der Forschungsfrage erscheinen konsistent (heuristisch).",
+            evidence=f"Begriffe: {', '.join(terms)}"
+    
+        )]
+class ResearchQuestionReferencedInResultsRule(Rule):
+    """
+    Check Nr. 4: Forschungsfrage wird im Ergebnisteil referenziert (heuristisch)
+    V1: Keywords aus RQ-Quelle extrahieren und in 'ergebnisse' Section suchen.
+    """
+    id = "RQ-004"
+    category = "Fragestellung"
+    severity = "warn"
+
+    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
+        results = doc.sections.get("ergebnisse")
+        if results is None:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message="Ergebnisse-Kapitel nicht erkannt – Check RQ-004 kann nicht sauber geprüft werden.",
+                evidence="Tipp: Überschrift als 'Ergebnisse' oder '4 Ergebnisse' formatieren/nummerieren."
+            )]
+
+        # RQ-Quelle bestimmen (wie in RQ-003, aus dem geteilten Kontext)
+        rq_source, terms = _rq_context(doc).source_and_terms(ai)
+
+        if not rq_source:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message="Keine Forschungsfrage/Ziel-Passage gefunden – kann Rückbezug in Ergebnissen nicht prüfen.",
+                evidence=None
+            )]
+
+        if not terms:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message="Keine zentralen Begriffe aus der Forschungsfrage ableitbar – Check RQ-004 übersprungen.",
+                evidence=f"RQ-Text: {rq_source[:200]}"
+            )]
+
+        results_tokens = set(_iter_tokens(results.text))
+        hits = [t for t in terms if t in results_tokens]
+
+        # Heuristik: mindestens 2 Treffer oder mindestens 35% der Terms
+        needed = max(2, int(len(terms) * 0.35))
+        if len(hits) >= needed:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="info",
+                message="Rückbezug auf zentrale Begriffe der Forschungsfrage im Ergebnisteil gefunden (heuristisch).",
+                evidence=f"Treffer: {', '.join(hits)}"
+            )]
+
+        return [Finding(
+            rule_id=self.id,
+            category=self.category,
+            severity="warn",
+            message="Wenig/kein Rückbezug auf zentrale Begriffe der Forschungsfrage im Ergebnisteil (heuristisch).",
+            evidence=f"Treffer: {', '.join(hits) or 'keine'} | Begriffe: {', '.join(terms)}"
+        )]
+
+
+class ResearchQuestionReferencedInDiscussionRule(Rule):
+    """
+    Check Nr. 5: Forschungsfrage wird in der Diskussion referenziert (heuristisch)
+    V1: Keywords aus RQ-Quelle extrahieren und in 'diskussion' Section suchen.
+    """
+    id = "RQ-005"
+    category = "Fragestellung"
+    severity = "warn"
+
+    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
+        discussion = doc.sections.get("diskussion")
+        if discussion is None:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message="Diskussion-Kapitel nicht erkannt – Check RQ-005 kann nicht sauber geprüft werden.",
+                evidence="Tipp: Überschrift als 'Diskussion' oder '5 Diskussion' formatieren/nummerieren."
+            )]
+
+        rq_source, terms = _rq_context(doc).source_and_terms(ai)
+
+        if not rq_source:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message="Keine Forschungsfrage/Ziel-Passage gefunden – kann Rückbezug in Diskussion nicht prüfen.",
+                evidence=None
+            )]
+
+        if not terms:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="warn",
+                message="Keine zentralen Begriffe aus der Forschungsfrage ableitbar – Check RQ-005 übersprungen.",
+                evidence=f"RQ-Text: {rq_source[:200]}"
+            )]
+
+        disc_tokens = set(_iter_tokens(discussion.text))
+        hits = [t for t in terms if t in disc_tokens]
+
+        needed = max(2, int(len(terms) * 0.35))
+        if len(hits) >= needed:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="info",
+                message="Rückbezug auf zentrale Begriffe der Forschungsfrage in der Diskussion gefunden (heuristisch).",
+                evidence=f"Treffer: {', '.join(hits)}"
+            )]
+
+        return [Finding(
+            rule_id=self.id,
+            category=self.category,
+            severity="warn",
+            message="Wenig/kein Rückbezug auf zentrale Begriffe der Forschungsfrage in der Diskussion (heuristisch).",
+            evidence=f"Treffer: {', '.join(hits) or 'keine'} | Begriffe: {', '.join(terms)}"
+        )]
@@ -5,7 +5,7 @@ from ..models.document_model import DocumentModel, AIAnnotations
 from ..models.findings import Finding
 
 
-EXPECTED_ORDER = ["einleitung", "theorie", "methode", "ergebnisse", "diskussion", "fazit", "literatur"]
+EXPECTED_ORDER = ("einleitung", "theorie", "methode", "ergebnisse", "diskussion", "fazit", "literatur")
 
 
 class ChapterOrderPlausibleRule(Rule):
@@ -21,7 +21,8 @@ class ChapterOrderPlausibleRule(Rule):
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
         # Wir approximieren die Reihenfolge über die Reihenfolge in EXPECTED_ORDER,
         # eingeschränkt auf die Kapitel, die erkannt wurden.
-        present = [k for k in EXPECTED_ORDER if k in doc.sections]
+        present_keys = doc.sections.keys()
+        present = [k for k in EXPECTED_ORDER if k in present_keys]
 
         # Wenn wir kaum Kapitel erkannt haben, macht Order-Check keinen Sinn.
         if len(present) < 3:
@@ -40,7 +41,7 @@ class ChapterOrderPlausibleRule(Rule):
         # (Verbessern wir später, wenn Sections echte Startpositionen haben.)
         missing_in_between = []
         for key in EXPECTED_ORDER:
-            if key not in doc.sections:
+            if key not in present_keys:
                 # nur "wichtige" Kapitel in der Mitte hervorheben
                 if key in {"theorie", "methode", "ergebnisse", "diskussion"}:
                     missing_in_between.append(key)
@@ -75,7 +76,8 @@ class ChapterLengthBalancedRule(Rule):
 
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
         # Nur Kapitel betrachten, die wir haben
-        keys = [k for k in EXPECTED_ORDER if k in doc.sections]
+        present_keys = doc.sections.keys()
+        keys = [k for k in EXPECTED_ORDER if k in present_keys]
         if len(keys) < 3:
             return [Finding(
                 rule_id=self.id,
@@ -86,11 +88,18 @@ class ChapterLengthBalancedRule(Rule):
             )]
 
         counts = {k: doc.sections[k].word_count for k in keys}
-        max_k = max(counts, key=counts.get)
-        min_k = min(counts, key=counts.get)
 
-        max_v = counts[max_k]
-        min_v = counts[min_k]
+        # beide Extrema in einem Durchlauf statt max() und min() mit
+        # key-Lookup pro Vergleich; bei Gleichstand gewinnt wie vorher
+        # der erste Eintrag
+        it = iter(counts.items())
+        max_k, max_v = next(it)
+        min_k, min_v = max_k, max_v
+        for k, v in it:
+            if v > max_v:
+                max_k, max_v = k, v
+            elif v < min_v:
+                min_k, min_v = k, v
 
         # Heuristik: wenn größtes Kapitel > 3x so groß wie kleinstes -> warn
         if min_v > 0 and max_v / min_v >= 3.0:
@@ -102,10 +111,22 @@ class ChapterLengthBalancedRule(Rule):
                 evidence=f"Größtes: {max_k} ({max_v} Wörter) | Kleinstes: {min_k} ({min_v} Wörter)"
             )]
 
+        # Evidence mit Budget aufbauen statt alles zu joinen und dann
+        # auf 350 Zeichen abzuschneiden; schneidet dabei nur an ganzen
+        # Einträgen, nicht mitten im Eintrag
+        parts = []
+        n = 0
+        for k, v in counts.items():
+            s = f"{k}:{v}"
+            n += len(s) + 3
+            if n > 350:
+                break
+            parts.append(s)
+
         return [Finding(
             rule_id=self.id,
             category=self.category,
             severity="info",
             message="Kapitelumfang wirkt grob ausgewogen (heuristisch).",
-            evidence=" | ".join([f"{k}:{v}" for k, v in counts.items()])[:350]
+            evidence=" | ".join(parts)
         )]
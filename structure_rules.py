@@ -13,10 +13,11 @@ class RequiredChaptersRule(Rule):
     category = "Struktur"
     severity = "error"
 
-    REQUIRED = ["einleitung", "theorie", "methode", "ergebnisse", "diskussion", "fazit", "literatur"]
+    REQUIRED = ("einleitung", "theorie", "methode", "ergebnisse", "diskussion", "fazit", "literatur")
 
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        present = set(doc.sections.keys())
+        # Keys-View reicht für Membership, kein Set-Kopieren nötig
+        present = doc.sections.keys()
         missing = [k for k in self.REQUIRED if k not in present]
 
         if missing:
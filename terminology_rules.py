@@ -2,6 +2,8 @@ import re
 from typing import List, Optional
 
 from .base import Rule
+from . import doc_cache
+from .text_norm import norm_title as _norm
 from ..models.document_model import DocumentModel, AIAnnotations
 from ..models.findings import Finding
 
@@ -15,35 +17,56 @@ ABBREV_SECTION_ALIASES = [
     "abbreviations",
 ]
 
-def _norm(s: str) -> str:
-    s = (s or "").strip().lower()
-    s = re.sub(r"\s+", " ", s)
-    s = re.sub(r"^\s*\d+(?:\.\d+)*\s*[\.\)]?\s*", "", s)
-    s = re.sub(r"[\s:;.\-–—]+$", "", s).strip()
-    return s
+# alle Patterns einmal beim Import kompilieren; die Rules laufen pro
+# Dokument und sollen nicht jedes Mal durch den re-Cache
+
+# TERM-015: Überschrift, Listen-Zeilen (ABK – Langform) und Akronyme in
+# EINEM Volltext-Scan; vorher waren das bis zu vier getrennte Pässe.
+# Nur die Überschrift matcht case-insensitiv (lokales (?i:...)), die
+# Großbuchstaben-Klassen bleiben case-sensitiv. [ \t]* statt \s*, damit
+# die Listen-Zeile im MULTILINE-Modus nicht über Zeilenenden läuft.
+_ABBREV_SCAN_RE = re.compile(
+    r"(?P<heading>\b(?i:abkürzungsverzeichnis|abkuerzungsverzeichnis|list of abbreviations)\b)"
+    r"|(?P<abbrevline>^[A-ZÄÖÜ0-9]{2,10}[ \t]*[:=\-–—][ \t]*\S+)"
+    r"|(?P<acronym>\b[A-ZÄÖÜ]{2,6}\b)",
+    re.MULTILINE,
+)
+
+# klassische Definitions-Muster (TERM-016) als eine Alternation:
+# ein Volltext-Pass statt fünf, und gezählt werden Vorkommen statt
+# nur "Pattern hat irgendwo getroffen"
+_CLASSIC_DEF_RE = re.compile(
+    r"(?:\bunter\s+(?:[A-Za-zÄÖÜäöüß\- ]{3,40})\s+versteht\s+man\b"
+    r"|\bist\s+definiert\s+als\b"
+    r"|\bwird\s+als\s+[^.\n]{1,80}\bdefiniert\b"
+    r"|\bdefinition\b"
+    r"|\bbezeichnet\b)",
+    re.IGNORECASE,
+)
+
+# Abkürzungseinführungen: Langform (ABK)
+# Die Langform muss auf einem Buchstaben enden und ist auf 60 Zeichen
+# gedeckelt, das Akronym steht ohne Innen-Whitespace in den Klammern –
+# so gibt es kein Backtracking zwischen Zeichenklasse und \s*( mehr
+_ABBR_INTRO_RE = re.compile(
+    r"\b([A-Za-zÄÖÜäöüß][A-Za-zÄÖÜäöüß\- ]{1,58}[A-Za-zÄÖÜäöüß])\s*\(([A-ZÄÖÜ]{2,10})\)"
+)
+
 
 def _has_section(doc: DocumentModel, aliases: List[str]) -> Optional[str]:
+    # Titel-Index einmal pro Dokument (geteilt mit structure_extra_rules,
+    # dieselbe Normalisierung); erst exakter Hash-Lookup, Substring nur
+    # als Fallback
     aliases_n = {_norm(a) for a in aliases}
-    for sec in doc.sections.values():
-        t = _norm(sec.title)
-        if t in aliases_n or any(a in t for a in aliases_n):
-            return sec.title
+    titles = doc_cache.section_title_index(doc, _norm)
+    for t, key in titles.items():
+        if t in aliases_n:
+            return doc.sections[key].title
+    for t, key in titles.items():
+        if any(a in t for a in aliases_n):
+            return doc.sections[key].title
     return None
 
-def _detect_abbrev_list_in_text(text: str) -> int:
-    """
-    erkennt typische Abkürzungsverzeichnis-Zeilen:
-      MRT – Magnetresonanztomographie
-      MRT: Magnetresonanztomographie
-      MRT = Magnetresonanztomographie
-    und auch Langform -> (ABK) als Liste ist seltener, aber möglich.
-    """
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    # ABK vorne (2-10 Großbuchstaben/Zahlen) + Separator + Erklärung
-    pat = re.compile(r"^[A-ZÄÖÜ0-9]{2,10}\s*(?:[:=\-–—])\s*\S+")
-    hits = sum(1 for ln in lines if pat.search(ln))
-    return hits
-
 class AbbreviationsListExistsRule(Rule):
     """
     TERM-015: Abkürzungsverzeichnis vorhanden (heuristisch)
@@ -66,11 +89,24 @@ class AbbreviationsListExistsRule(Rule):
                 evidence=f"Titel: {found_title}"
             )]
 
-        full_text = "\n".join([p for p in doc.paragraphs if p])
+        full_text = doc_cache.full_text(doc)
+
+        # ein Scan statt heading-Suche + 2x Listen-Zählung + Akronym-findall;
+        # die Zeilen-Abgrenzung macht ^ im MULTILINE-Modus in C
+        heading_hit = False
+        hits = 0
+        acronyms = set()
+        for m in _ABBREV_SCAN_RE.finditer(full_text):
+            g = m.lastgroup
+            if g == "acronym":
+                acronyms.add(m.group())
+            elif g == "abbrevline":
+                hits += 1
+            else:
+                heading_hit = True
+
         # 1) direkt "Abkürzungsverzeichnis" irgendwo (auch ohne Section)
-        if re.search(r"\b(abkürzungsverzeichnis|abkuerzungsverzeichnis|list of abbreviations)\b",
-                     full_text, flags=re.IGNORECASE):
-            hits = _detect_abbrev_list_in_text(full_text)
+        if heading_hit:
             sev = "info" if hits >= 5 else "warn"
             return [Finding(
                 rule_id=self.id,
@@ -81,7 +117,6 @@ class AbbreviationsListExistsRule(Rule):
             )]
 
         # 2) reines Listenmuster ohne Überschrift (z.B. nur die Liste)
-        hits = _detect_abbrev_list_in_text(full_text)
         if hits >= 6:
             return [Finding(
                 rule_id=self.id,
@@ -92,9 +127,9 @@ class AbbreviationsListExistsRule(Rule):
             )]
 
         # 3) wenn nur wenige Akronyme insgesamt, dann nur info
-        acronyms = re.findall(r"\b[A-ZÄÖÜ]{2,6}\b", full_text)
-        acronyms = [a for a in acronyms if a not in {"UND", "ODER"}]
-        unique = sorted(set(acronyms))
+        acronyms.discard("UND")
+        acronyms.discard("ODER")
+        unique = sorted(acronyms)
         if len(unique) < 12:
             return [Finding(
                 rule_id=self.id,
@@ -125,27 +160,11 @@ class DefinitionsPresentRule(Rule):
     severity = "info"
 
     def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        text = "\n".join([p for p in doc.paragraphs if p])
-
-        # 1) Klassische Definitionen
-        classic_patterns = [
-            r"\bunter\s+([A-Za-zÄÖÜäöüß\- ]{3,40})\s+versteht\s+man\b",
-            r"\bist\s+definiert\s+als\b",
-            r"\bwird\s+als\b\s+.*\bdefiniert\b",
-            r"\bdefinition\b",
-            r"\bbezeichnet\b",
-        ]
-        classic_hits = 0
-        for pat in classic_patterns:
-            if re.search(pat, text, flags=re.IGNORECASE):
-                classic_hits += 1
+        text = doc_cache.full_text(doc)
 
-        # 2) Abkürzungseinführungen: Langform (ABK)
+        # 1) Abkürzungseinführungen: Langform (ABK)
         # Beispiel: "Magnetresonanztomographie (MRT)" / "deep learning (DL)"
-        abbr_intro = re.findall(
-            r"\b([A-Za-zÄÖÜäöüß][A-Za-zÄÖÜäöüß\- ]{3,80})\s*\(\s*([A-ZÄÖÜ]{2,10})\s*\)",
-            text
-        )
+        abbr_intro = _ABBR_INTRO_RE.findall(text)
         # Filter: Langform soll mindestens 2 Wörter haben (vermeidet "siehe (Abb.)" etc.)
         abbr_intro = [(lf.strip(), abk.strip()) for (lf, abk) in abbr_intro if len(lf.strip().split()) >= 2]
 
@@ -155,6 +174,13 @@ class DefinitionsPresentRule(Rule):
             if abk not in abbr_unique:
                 abbr_unique[abk] = lf
 
+        # 2) Klassische Definitionen – nur wenn die ABK-Einführungen das
+        # Ergebnis nicht sowieso schon tragen (>= 5 unique), der Scan ist
+        # der teurere der beiden
+        classic_hits = 0
+        if len(abbr_unique) < 5:
+            classic_hits = sum(1 for _ in _CLASSIC_DEF_RE.finditer(text))
+
         # Bewertung
         if classic_hits > 0 or len(abbr_unique) >= 5:
             ev = []
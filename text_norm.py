@@ -0,0 +1,31 @@
+"""
+Gemeinsame Normalisierung für Section-Titel und Aliase.
+
+terminology_rules und structure_extra_rules hatten historisch je eine
+eigene, identische _norm-Implementierung; hier liegt die eine Version,
+damit die beiden nicht wieder auseinanderlaufen (der geteilte
+Titel-Index in doc_cache setzt identische Normalisierung voraus).
+
+norm_title ist lru-gecacht: die Inputs (Section-Titel plus eine feste
+Menge Aliase) wiederholen sich über Dokumente hinweg fast vollständig.
+Für längere Texte gibt es norm_text ohne Cache, damit keine großen
+Strings im LRU hängen bleiben.
+"""
+
+import functools
+
+
+def norm_text(s: str) -> str:
+    if not s:
+        return ""
+    s = " ".join(s.lower().split())
+    # führende Nummern killen: "9. Fazit", "1.2) Methode"
+    i = 0
+    while i < len(s) and (s[i].isdigit() or s[i] in ".)"):
+        i += 1
+    s = s[i:].lstrip()
+    # trailing punctuation
+    return s.rstrip(" :;.-–—")
+
+
+norm_title = functools.lru_cache(maxsize=8192)(norm_text)
@@ -1,175 +1,266 @@
-import re
-import unicodedata
-from typing import List, Optional
-
-from .base import Rule
-from ..models.document_model import DocumentModel, AIAnnotations
-from ..models.findings import Finding
-
-
-def _norm(s: str) -> str:
-    s = unicodedata.normalize("NFKC", s or "")
-    s = s.replace("\u00A0", " ")
-    s = re.sub(r"\s+", " ", s).strip().lower()
-    return s
-
-
-def _looks_like_toc_line(p: str) -> bool:
-    # Leaderpunkte
-    t = _norm(p)
-    if not t:
-        return False
-    if "...." in t or re.search(r"\.{3,}", t):
-        return True
-
-    # "1.Einleitung1" oder "4.2GAN17" (Nummer + Text + Seitenzahl angehängt)
-    if re.match(r"^\d+(\.\d+)*[a-zäöüß].*\d{1,4}$", t):
-        return True
-
-    # "6. Ergebnisse 24" / "Ergebnisse 24"
-    if re.match(r"^\d+(\.\d+)*\s+.+\s+\d{1,4}$", t):
-        return True
-    if re.match(r"^[a-zäöüß].+\s+\d{1,4}$", t):
-        return True
-
-    return False
-
-
-def _find_heading_like_line(paragraphs: List[str], variants: List[str]) -> Optional[int]:
-    wanted = {_norm(v) for v in variants}
-    for i, p in enumerate(paragraphs):
-        if _norm(p) in wanted:
-            return i
-    return None
-
-
-class TableOfContentsExistsRule(Rule):
-    """
-    STRUCT-015: Inhaltsverzeichnis vorhanden + (heuristisch) enthält echte TOC-Zeilen.
-    """
-    id = "STRUCT-015"
-    category = "Struktur"
-    severity = "error"
-
-    TOC_TITLES = ["inhaltsverzeichnis", "table of contents", "contents"]
-
-    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        idx = _find_heading_like_line(doc.paragraphs, self.TOC_TITLES)
-        if idx is None:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="error",
-                message="Kein Inhaltsverzeichnis erkannt.",
-                evidence="Tipp: Überschrift 'Inhaltsverzeichnis' verwenden."
-            )]
-
-        # Heuristik: nach der Überschrift sollten einige TOC-Zeilen folgen
-        window = doc.paragraphs[idx + 1: idx + 40]
-        toc_like = sum(1 for p in window if _looks_like_toc_line(p))
-        if toc_like >= 3:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="info",
-                message="Inhaltsverzeichnis erkannt.",
-                evidence=f"Position: Absatz {idx} | TOC-Zeilen (heuristisch): {toc_like}"
-            )]
-
-        return [Finding(
-            rule_id=self.id,
-            category=self.category,
-            severity="warn",
-            message="Inhaltsverzeichnis-Überschrift gefunden, aber Inhalt wirkt unklar (heuristisch).",
-            evidence=f"Position: Absatz {idx} | TOC-Zeilen (heuristisch): {toc_like}"
-        )]
-
-
-class ListOfFiguresExistsRule(Rule):
-    """
-    FORM-039: Abbildungsverzeichnis vorhanden, wenn Abbildungen existieren.
-    """
-    id = "FORM-039"
-    category = "Formales"
-    severity = "error"
-
-    FIG_TITLES = [
-        "abbildungsverzeichnis",
-        "verzeichnis der abbildungen",
-        "list of figures",
-        "figures",
-    ]
-
-    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        # Wenn keine Abbildungen referenziert werden -> Info (nicht erforderlich)
-        if not doc.figure_refs or len(doc.figure_refs) == 0:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="info",
-                message="Keine Abbildungs-Referenzen erkannt – Abbildungsverzeichnis nicht erforderlich (heuristisch).",
-                evidence=None
-            )]
-
-        idx = _find_heading_like_line(doc.paragraphs, self.FIG_TITLES)
-        if idx is None:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="error",
-                message="Abbildungsverzeichnis fehlt (Pflicht, da Abbildungen vorhanden sind).",
-                evidence=f"Erkannte Abbildungs-Refs: {len(doc.figure_refs)}"
-            )]
-
-        return [Finding(
-            rule_id=self.id,
-            category=self.category,
-            severity="info",
-            message="Abbildungsverzeichnis erkannt.",
-            evidence=f"Position: Absatz {idx} | Abbildungs-Refs im Text: {len(doc.figure_refs)}"
-        )]
-
-
-class ListOfTablesExistsRule(Rule):
-    """
-    FORM-040: Tabellenverzeichnis vorhanden, wenn Tabellen existieren.
-    """
-    id = "FORM-040"
-    category = "Formales"
-    severity = "error"
-
-    TAB_TITLES = [
-        "tabellenverzeichnis",
-        "verzeichnis der tabellen",
-        "list of tables",
-        "tables",
-    ]
-
-    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
-        # tables_count kommt aus python-docx (physische Tabellen)
-        if not doc.tables_count or doc.tables_count <= 0:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="info",
-                message="Keine Tabellen erkannt – Tabellenverzeichnis nicht erforderlich.",
-                evidence=None
-            )]
-
-        idx = _find_heading_like_line(doc.paragraphs, self.TAB_TITLES)
-        if idx is None:
-            return [Finding(
-                rule_id=self.id,
-                category=self.category,
-                severity="error",
-                message="Tabellenverzeichnis fehlt (Pflicht, da Tabellen vorhanden sind).",
-                evidence=f"Tabellen im Dokument: {doc.tables_count}"
-            )]
-
-        return [Finding(
-            rule_id=self.id,
-            category=self.category,
-            severity="info",
-            message="Tabellenverzeichnis erkannt.",
-            evidence=f"Position: Absatz {idx} | Tabellen im Dokument: {doc.tables_count}"
-        )]
+import re
+import unicodedata
+from typing import List, Optional
+
+from .base import Rule
+from ..models.document_model import DocumentModel, AIAnnotations
+from ..models.findings import Finding
+
+
+# Patterns einmal beim Import kompilieren; _looks_like_toc_line läuft
+# pro Absatz und soll nicht jedes Mal durch den re-Cache
+
+# alle drei TOC-Zeilen-Formen beginnen mit Ziffer oder Kleinbuchstabe –
+# alles andere fliegt mit einem Set-Lookup raus, ohne die Regex-Engine
+_TOC_LOWER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzäöüß")
+_TOC_FIRST_CHARS = frozenset("0123456789") | _TOC_LOWER_CHARS
+
+# "6. Ergebnisse 24"
+_TOC_NUM_TEXT_PAGE_RE = re.compile(r"^\d+(\.\d+)*\s+.+\s+\d{1,4}$")
+# "Ergebnisse 24"
+_TOC_TEXT_PAGE_RE = re.compile(r"^[a-zäöüß].+\s+\d{1,4}$")
+
+
+def _norm(s: str) -> str:
+    # str.split() ohne Argument trennt an beliebigem Unicode-Whitespace
+    # (auch \u00A0), das deckt NBSP-Ersetzung + \s+-Collapse + strip ab
+    s = unicodedata.normalize("NFKC", s or "")
+    return " ".join(s.split()).lower()
+
+
+def _is_num_glued_toc_line(t: str) -> bool:
+    """
+    "4.2gan17" (Nummer + Text + Seitenzahl zusammengeklebt): Ziffern-/
+    Punkt-Präfix per Char-Scan ablaufen statt ^\\d+(\\.\\d+)*[a-zäöüß]
+    mit .*-Backtracking. Der Caller hat die Seitenzahl am Ende
+    (t[-1].isdigit()) schon geprüft, das deckt .*\\d{1,4}$ ab.
+    """
+    if not t[0].isdigit():
+        return False
+    i = 1
+    n = len(t)
+    while i < n and t[i].isdigit():
+        i += 1
+    # optionale ".Ziffern"-Gruppen; ein Punkt ohne Ziffer dahinter
+    # gehört nicht mehr zum Präfix
+    while i < n and t[i] == ".":
+        j = i + 1
+        if j < n and t[j].isdigit():
+            while j < n and t[j].isdigit():
+                j += 1
+            i = j
+        else:
+            break
+    return i < n and t[i] in _TOC_LOWER_CHARS
+
+
+def _looks_like_toc_line(p: str) -> bool:
+    t = _norm(p)
+    if not t:
+        return False
+    # Leaderpunkte: der Substring-Test deckt \.{3,} komplett ab
+    if "..." in t:
+        return True
+
+    # Fast-Reject: falsches Anfangszeichen oder keine Seitenzahl am Ende
+    if t[0] not in _TOC_FIRST_CHARS or not t[-1].isdigit():
+        return False
+
+    if _is_num_glued_toc_line(t):
+        return True
+
+    if _TOC_NUM_TEXT_PAGE_RE.match(t):
+        return True
+    if _TOC_TEXT_PAGE_RE.match(t):
+        return True
+
+    return False
+
+
+_NORM_PARAS_ATTR = "_cache_toc_norm_paragraphs"
+
+# Verzeichnis-Titel sind kurz ("verzeichnis der abbildungen" = 26 Zeichen);
+# längere Absätze können kein Titel sein und werden gar nicht normalisiert
+_MAX_HEADING_LEN = 64
+
+
+def _normed_paragraphs(doc: DocumentModel) -> List[str]:
+    """
+    Normalisierte Absätze, einmal pro Dokument berechnet – die drei
+    Verzeichnis-Rules (TOC/Abbildungen/Tabellen) normalisieren sonst
+    dieselben Absätze dreimal. Fließtext-Absätze über _MAX_HEADING_LEN
+    stehen als "" im Cache (matchen nie einen Titel).
+    """
+    cached = getattr(doc, _NORM_PARAS_ATTR, None)
+    if cached is None:
+        cached = [_norm(p) if len(p) <= _MAX_HEADING_LEN else "" for p in doc.paragraphs]
+        try:
+            setattr(doc, _NORM_PARAS_ATTR, cached)
+        except Exception:
+            pass
+    return cached
+
+
+_HEADING_INDEX_ATTR = "_cache_toc_heading_index"
+
+
+def _heading_index(doc: DocumentModel) -> dict:
+    """
+    {normalisierter Absatz: erster Index}, einmal pro Dokument – damit
+    machen TOC-, Abbildungs- und Tabellen-Rule zusammen genau einen
+    Durchlauf über die Absätze statt je einen eigenen.
+    """
+    cached = getattr(doc, _HEADING_INDEX_ATTR, None)
+    if cached is None:
+        cached = {}
+        for i, t in enumerate(_normed_paragraphs(doc)):
+            if t and t not in cached:
+                cached[t] = i
+        try:
+            setattr(doc, _HEADING_INDEX_ATTR, cached)
+        except Exception:
+            pass
+    return cached
+
+
+def _find_heading_like_line(doc: DocumentModel, variants: List[str]) -> Optional[int]:
+    # wie der alte Linear-Scan: der früheste Treffer über alle Varianten
+    index = _heading_index(doc)
+    best: Optional[int] = None
+    for v in variants:
+        i = index.get(_norm(v))
+        if i is not None and (best is None or i < best):
+            best = i
+    return best
+
+
+class TableOfContentsExistsRule(Rule):
+    """
+    STRUCT-015: Inhaltsverzeichnis vorhanden + (heuristisch) enthält echte TOC-Zeilen.
+    """
+    id = "STRUCT-015"
+    category = "Struktur"
+    severity = "error"
+
+    TOC_TITLES = ["inhaltsverzeichnis", "table of contents", "contents"]
+
+    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
+        idx = _find_heading_like_line(doc, self.TOC_TITLES)
+        if idx is None:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="error",
+                message="Kein Inhaltsverzeichnis erkannt.",
+                evidence="Tipp: Überschrift 'Inhaltsverzeichnis' verwenden."
+            )]
+
+        # Heuristik: nach der Überschrift sollten einige TOC-Zeilen folgen
+        window = doc.paragraphs[idx + 1: idx + 40]
+        toc_like = sum(1 for p in window if _looks_like_toc_line(p))
+        if toc_like >= 3:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="info",
+                message="Inhaltsverzeichnis erkannt.",
+                evidence=f"Position: Absatz {idx} | TOC-Zeilen (heuristisch): {toc_like}"
+            )]
+
+        return [Finding(
+            rule_id=self.id,
+            category=self.category,
+            severity="warn",
+            message="Inhaltsverzeichnis-Überschrift gefunden, aber Inhalt wirkt unklar (heuristisch).",
+            evidence=f"Position: Absatz {idx} | TOC-Zeilen (heuristisch): {toc_like}"
+        )]
+
+
+class ListOfFiguresExistsRule(Rule):
+    """
+    FORM-039: Abbildungsverzeichnis vorhanden, wenn Abbildungen existieren.
+    """
+    id = "FORM-039"
+    category = "Formales"
+    severity = "error"
+
+    FIG_TITLES = [
+        "abbildungsverzeichnis",
+        "verzeichnis der abbildungen",
+        "list of figures",
+        "figures",
+    ]
+
+    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
+        # Wenn keine Abbildungen referenziert werden -> Info (nicht erforderlich)
+        if not doc.figure_refs or len(doc.figure_refs) == 0:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="info",
+                message="Keine Abbildungs-Referenzen erkannt – Abbildungsverzeichnis nicht erforderlich (heuristisch).",
+                evidence=None
+            )]
+
+        idx = _find_heading_like_line(doc, self.FIG_TITLES)
+        if idx is None:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="error",
+                message="Abbildungsverzeichnis fehlt (Pflicht, da Abbildungen vorhanden sind).",
+                evidence=f"Erkannte Abbildungs-Refs: {len(doc.figure_refs)}"
+            )]
+
+        return [Finding(
+            rule_id=self.id,
+            category=self.category,
+            severity="info",
+            message="Abbildungsverzeichnis erkannt.",
+            evidence=f"Position: Absatz {idx} | Abbildungs-Refs im Text: {len(doc.figure_refs)}"
+        )]
+
+
+class ListOfTablesExistsRule(Rule):
+    """
+    FORM-040: Tabellenverzeichnis vorhanden, wenn Tabellen existieren.
+    """
+    id = "FORM-040"
+    category = "Formales"
+    severity = "error"
+
+    TAB_TITLES = [
+        "tabellenverzeichnis",
+        "verzeichnis der tabellen",
+        "list of tables",
+        "tables",
+    ]
+
+    def run(self, doc: DocumentModel, ai: Optional[AIAnnotations] = None) -> List[Finding]:
+        # tables_count kommt aus python-docx (physische Tabellen)
+        if not doc.tables_count or doc.tables_count <= 0:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="info",
+                message="Keine Tabellen erkannt – Tabellenverzeichnis nicht erforderlich.",
+                evidence=None
+            )]
+
+        idx = _find_heading_like_line(doc, self.TAB_TITLES)
+        if idx is None:
+            return [Finding(
+                rule_id=self.id,
+                category=self.category,
+                severity="error",
+                message="Tabellenverzeichnis fehlt (Pflicht, da Tabellen vorhanden sind).",
+                evidence=f"Tabellen im Dokument: {doc.tables_count}"
+            )]
+
+        return [Finding(
+            rule_id=self.id,
+            category=self.category,
+            severity="info",
+            message="Tabellenverzeichnis erkannt.",
+            evidence=f"Position: Absatz {idx} | Tabellen im Dokument: {doc.tables_count}"
+        )]